@@ -3,29 +3,101 @@
 Generate Statement of Work (SoW) document for Sparking - Smart Parking Management System
 """
 
+import argparse
 import os
+import io
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import inspect
+from xml.sax.saxutils import escape
 from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.shared import Inches, Pt, Cm, Emu, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import parse_xml
+from docx.oxml.table import CT_Tbl
+from docx.table import Table
+import matplotlib
+matplotlib.use('Agg')  # File output only; never start a GUI backend
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle, Rectangle
+from matplotlib.patches import FancyBboxPatch, Circle, Rectangle
+from matplotlib.collections import LineCollection, PatchCollection
 import numpy as np
 
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
+# The PNGs only feed the .docx (which is itself deflated), so favour encode speed
+PNG_OPTIONS = {'compress_level': 1, 'optimize': False}
+
 # Output directory
 OUTPUT_DIR = "/Users/sudipto/Desktop/projects/sparking/sow_documents"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
-
+SOW_PATH = os.path.join(OUTPUT_DIR, 'SPARKING_Statement_of_Work.docx')
+
+# Shared formatting values (Length/RGBColor objects), built once
+PAGE_MARGIN = Cm(2.5)
+DIAGRAM_WIDTH = Inches(6.5)
+TITLE_PT, SUBTITLE_PT, TAGLINE_PT, BODY_PT = Pt(28), Pt(36), Pt(16), Pt(12)
+PARAGRAPH_GAP = Pt(12)
+CLOSING_GAP = Pt(24)
+TOC_ROW_GAP = Pt(6)
+TOC_NUMBER_WIDTH, TOC_TITLE_WIDTH, TOC_PAGE_WIDTH = Cm(1.5), Cm(12), Cm(2)
+TITLE_COLOR = RGBColor(26, 54, 93)
+SUBTITLE_COLOR = RGBColor(46, 125, 50)
+TAGLINE_COLOR = RGBColor(97, 97, 97)
+VERSION_COLOR = RGBColor(117, 117, 117)
+HEADER_TEXT_COLOR = RGBColor(255, 255, 255)
+
+
+def cached_diagram(filename):
+    """Skip re-rendering a diagram whose drawing code hasn't changed since the last run.
+
+    The drawing code is the whole spec for these diagrams, so its source (plus the
+    matplotlib version, rcParams and PNG_OPTIONS) is hashed into a key stored next
+    to the PNG as <png>.meta. When the source can't be read (e.g. no .py file on
+    disk) it always re-renders.
+    """
+    def decorator(render):
+        try:
+            source = inspect.getsource(render)
+        except (TypeError, OSError):
+            key = None
+        else:
+            spec = (source + matplotlib.__version__ + repr(sorted(plt.rcParams.items()))
+                    + repr(PNG_OPTIONS))
+            key = hashlib.blake2b(spec.encode('utf-8')).hexdigest()
+
+        @functools.wraps(render)
+        def wrapper():
+            filepath = os.path.join(OUTPUT_DIR, filename)
+            meta_path = filepath + '.meta'
+            if key is not None and os.path.exists(filepath) and os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    if f.read().strip() == key:
+                        print(f"Up to date: {filepath}")
+                        return filepath
+            filepath = render()
+            if key is not None:
+                with open(meta_path, 'w') as f:
+                    f.write(key)
+            return filepath
+        return wrapper
+    return decorator
+
+@cached_diagram('data_flow_diagram.png')
 def create_data_flow_diagram():
     """Create a comprehensive data flow diagram"""
     fig, ax = plt.subplots(1, 1, figsize=(16, 12))
     ax.set_xlim(0, 16)
     ax.set_ylim(0, 12)
-    ax.set_aspect('equal')
+    # Fixed limits: don't recompute data limits as artists are added
+    ax.set_autoscale_on(False)
+    ax.use_sticky_edges = False
     ax.axis('off')
 
     # Title
@@ -41,69 +113,73 @@ def create_data_flow_diagram():
         'border': '#37474F'
     }
 
-    def draw_box(x, y, w, h, label, color, fontsize=9, bold=False):
-        rect = FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.02,rounding_size=0.1",
-                              facecolor=color, edgecolor=colors['border'], linewidth=1.5)
-        ax.add_patch(rect)
-        weight = 'bold' if bold else 'normal'
-        ax.text(x + w/2, y + h/2, label, ha='center', va='center', fontsize=fontsize,
-                fontweight=weight, wrap=True)
+    # Boxes and cylinders are queued here and drawn as a single collection
+    patches = []
 
     def draw_cylinder(x, y, w, h, label):
         # Database cylinder
         ellipse_h = h * 0.15
         rect = Rectangle((x, y + ellipse_h/2), w, h - ellipse_h,
                          facecolor=colors['database'], edgecolor=colors['border'], linewidth=1.5)
-        ax.add_patch(rect)
+        patches.append(rect)
         # Top ellipse
         ellipse_top = mpatches.Ellipse((x + w/2, y + h - ellipse_h/2), w, ellipse_h,
                                        facecolor=colors['database'], edgecolor=colors['border'], linewidth=1.5)
-        ax.add_patch(ellipse_top)
+        patches.append(ellipse_top)
         # Bottom ellipse
         ellipse_bottom = mpatches.Ellipse((x + w/2, y + ellipse_h/2), w, ellipse_h,
                                           facecolor=colors['database'], edgecolor=colors['border'], linewidth=1.5)
-        ax.add_patch(ellipse_bottom)
+        patches.append(ellipse_bottom)
         ax.text(x + w/2, y + h/2, label, ha='center', va='center', fontsize=8, fontweight='bold')
 
-    def draw_arrow(start, end, label='', color='#455A64', curved=False):
-        style = "Simple, tail_width=0.3, head_width=4, head_length=4"
-        if curved:
-            arrow = FancyArrowPatch(start, end, connectionstyle="arc3,rad=0.2",
-                                   arrowstyle=style, color=color, linewidth=1)
-        else:
-            arrow = FancyArrowPatch(start, end, arrowstyle=style, color=color, linewidth=1)
-        ax.add_patch(arrow)
+    # Arrows are queued too: shafts become one LineCollection, heads one quiver
+    arrows = []
+
+    def draw_arrow(start, end, label='', color='#455A64'):
+        arrows.append((start, end, color))
         if label:
             mid_x = (start[0] + end[0]) / 2
             mid_y = (start[1] + end[1]) / 2
             ax.text(mid_x, mid_y + 0.2, label, fontsize=7, ha='center', color='#37474F')
 
-    # External Entities (Row 1)
-    draw_box(0.5, 9.5, 2, 1.2, 'Vehicle\nOwner/Driver', colors['external'], bold=True)
-    draw_box(3.5, 9.5, 2, 1.2, 'Kiosk\nTerminal', colors['external'], bold=True)
-    draw_box(6.5, 9.5, 2, 1.2, 'Mobile App\n(Future)', colors['external'], bold=True)
-    draw_box(9.5, 9.5, 2, 1.2, 'Parking\nOperator', colors['external'], bold=True)
-    draw_box(12.5, 9.5, 2.5, 1.2, 'System\nAdministrator', colors['external'], bold=True)
-
-    # Core Processes (Row 2)
-    draw_box(0.5, 7, 2.5, 1.3, '1.0\nEntry/Exit\nManagement', colors['process'], bold=True)
-    draw_box(4, 7, 2.5, 1.3, '2.0\nToken\nGeneration', colors['process'], bold=True)
-    draw_box(7.5, 7, 2.5, 1.3, '3.0\nSlot\nAllocation', colors['process'], bold=True)
-    draw_box(11, 7, 2.5, 1.3, '4.0\nPayment\nProcessing', colors['process'], bold=True)
-
-    # AI & Real-time Layer (Row 3)
-    draw_box(0.5, 4.5, 3, 1.3, '5.0\nAI Vehicle/Plate\nDetection', colors['ai'], bold=True)
-    draw_box(4.5, 4.5, 3, 1.3, '6.0\nReal-time\nOccupancy Tracking', colors['ai'], bold=True)
-    draw_box(8.5, 4.5, 3, 1.3, '7.0\nWallet & Transaction\nManagement', colors['process'], bold=True)
-    draw_box(12.5, 4.5, 2.5, 1.3, '8.0\nAnalytics &\nReporting', colors['process'], bold=True)
-
-    # Hardware Layer (Row 4)
-    draw_box(0.5, 2.5, 2, 1, 'CCTV\nCameras', colors['external'], fontsize=8)
-    draw_box(3, 2.5, 2, 1, 'Entry/Exit\nGates', colors['external'], fontsize=8)
-    draw_box(5.5, 2.5, 2, 1, 'Display\nBoards', colors['external'], fontsize=8)
-    draw_box(8, 2.5, 2, 1, 'Payment\nGateways', colors['external'], fontsize=8)
-    draw_box(10.5, 2.5, 2, 1, 'Bank\nAPIs', colors['external'], fontsize=8)
-    draw_box(13, 2.5, 2, 1, 'Email/SMS\nServices', colors['external'], fontsize=8)
+    # Boxes, one row each: x, y, w, h, label, color key, font size, bold
+    boxes = [
+        # External Entities (Row 1)
+        (0.5, 9.5, 2, 1.2, 'Vehicle\nOwner/Driver', 'external', 9, True),
+        (3.5, 9.5, 2, 1.2, 'Kiosk\nTerminal', 'external', 9, True),
+        (6.5, 9.5, 2, 1.2, 'Mobile App\n(Future)', 'external', 9, True),
+        (9.5, 9.5, 2, 1.2, 'Parking\nOperator', 'external', 9, True),
+        (12.5, 9.5, 2.5, 1.2, 'System\nAdministrator', 'external', 9, True),
+        # Core Processes (Row 2)
+        (0.5, 7, 2.5, 1.3, '1.0\nEntry/Exit\nManagement', 'process', 9, True),
+        (4, 7, 2.5, 1.3, '2.0\nToken\nGeneration', 'process', 9, True),
+        (7.5, 7, 2.5, 1.3, '3.0\nSlot\nAllocation', 'process', 9, True),
+        (11, 7, 2.5, 1.3, '4.0\nPayment\nProcessing', 'process', 9, True),
+        # AI & Real-time Layer (Row 3)
+        (0.5, 4.5, 3, 1.3, '5.0\nAI Vehicle/Plate\nDetection', 'ai', 9, True),
+        (4.5, 4.5, 3, 1.3, '6.0\nReal-time\nOccupancy Tracking', 'ai', 9, True),
+        (8.5, 4.5, 3, 1.3, '7.0\nWallet & Transaction\nManagement', 'process', 9, True),
+        (12.5, 4.5, 2.5, 1.3, '8.0\nAnalytics &\nReporting', 'process', 9, True),
+        # Hardware Layer (Row 4)
+        (0.5, 2.5, 2, 1, 'CCTV\nCameras', 'external', 8, False),
+        (3, 2.5, 2, 1, 'Entry/Exit\nGates', 'external', 8, False),
+        (5.5, 2.5, 2, 1, 'Display\nBoards', 'external', 8, False),
+        (8, 2.5, 2, 1, 'Payment\nGateways', 'external', 8, False),
+        (10.5, 2.5, 2, 1, 'Bank\nAPIs', 'external', 8, False),
+        (13, 2.5, 2, 1, 'Email/SMS\nServices', 'external', 8, False),
+        # Legend
+        (14, 2, 1.5, 0.4, 'External Entity', 'external', 7, False),
+        (14, 1.5, 1.5, 0.4, 'Process', 'process', 7, False),
+        (14, 1, 1.5, 0.4, 'AI Component', 'ai', 7, False),
+        (14, 0.5, 1.5, 0.4, 'Data Store', 'database', 7, False),
+    ]
+    geometry = np.array([box[:4] for box in boxes], dtype=float)
+    centers = geometry[:, :2] + geometry[:, 2:] / 2
+    for (x, y, w, h), (cx, cy), (*_, label, color, fontsize, bold) in zip(geometry, centers, boxes):
+        patches.append(FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.02,rounding_size=0.1",
+                                      facecolor=colors[color], edgecolor=colors['border'], linewidth=1.5))
+        ax.text(cx, cy, label, ha='center', va='center', fontsize=fontsize,
+                fontweight='bold' if bold else 'normal', wrap=True)
 
     # Data Stores (Bottom)
     draw_cylinder(1, 0.3, 2.5, 1.5, 'PostgreSQL\nDatabase')
@@ -142,27 +218,37 @@ def create_data_flow_diagram():
     draw_arrow((8.75, 2.5), (8.75, 1.8), '')
     draw_arrow((12.25, 4.5), (12.25, 1.8), '')
 
-    # Legend
-    legend_y = 0.3
-    draw_box(14, 2, 1.5, 0.4, 'External Entity', colors['external'], fontsize=7)
-    draw_box(14, 1.5, 1.5, 0.4, 'Process', colors['process'], fontsize=7)
-    draw_box(14, 1, 1.5, 0.4, 'AI Component', colors['ai'], fontsize=7)
-    draw_box(14, 0.5, 1.5, 0.4, 'Data Store', colors['database'], fontsize=7)
-
-    plt.tight_layout()
+    ax.add_collection(PatchCollection(patches, match_original=True))
+
+    segments = np.array([(start, end) for start, end, _ in arrows], dtype=float)
+    arrow_colors = [color for _, _, color in arrows]
+    ax.add_collection(LineCollection(segments, colors=arrow_colors, linewidths=1.3, zorder=2))
+    # Unit-length heads pinned at each end point; sizes are in data units (0.01 = 1.5px)
+    direction = segments[:, 1] - segments[:, 0]
+    direction /= np.hypot(direction[:, 0], direction[:, 1])[:, None]
+    ax.quiver(segments[:, 1, 0], segments[:, 1, 1], direction[:, 0], direction[:, 1],
+              color=arrow_colors, angles='xy', scale_units='xy', scale=1 / 0.08, units='xy',
+              width=0.01, headwidth=7, headlength=8, headaxislength=8, pivot='tip', zorder=2)
+
+    # The figure size matches the axes limits, so the axes can fill it exactly;
+    # no tight bbox (and the extra render pass it costs) is needed
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     filepath = os.path.join(OUTPUT_DIR, 'data_flow_diagram.png')
-    plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.savefig(filepath, dpi=150, pad_inches=0.1, facecolor='white', edgecolor='none', pil_kwargs=PNG_OPTIONS)
     plt.close()
     print(f"Created: {filepath}")
     return filepath
 
 
+@cached_diagram('software_architecture_diagram.png')
 def create_architecture_diagram():
     """Create a software architecture diagram"""
     fig, ax = plt.subplots(1, 1, figsize=(18, 16))
     ax.set_xlim(0, 18)
     ax.set_ylim(0, 16)
-    ax.set_aspect('equal')
+    # Fixed limits: don't recompute data limits as artists are added
+    ax.set_autoscale_on(False)
+    ax.use_sticky_edges = False
     ax.axis('off')
 
     # Title
@@ -182,17 +268,20 @@ def create_architecture_diagram():
         'border': '#37474F'
     }
 
+    # Layers and components are queued in drawing order and added as one collection
+    patches = []
+
     def draw_layer(y, height, color, label, width=14):
         rect = FancyBboxPatch((0.5, y), width, height, boxstyle="round,pad=0.02,rounding_size=0.2",
                               facecolor=color, edgecolor=colors['border'], linewidth=2, alpha=0.7)
-        ax.add_patch(rect)
+        patches.append(rect)
         ax.text(0.9, y + height - 0.35, label, fontsize=10, fontweight='bold',
                 va='top', color='#1a365d')
 
     def draw_component(x, y, w, h, label, sublabel='', color='white', fontsize_main=8, fontsize_sub=6):
         rect = FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.02,rounding_size=0.1",
                               facecolor=color, edgecolor=colors['border'], linewidth=1.5)
-        ax.add_patch(rect)
+        patches.append(rect)
         if sublabel:
             ax.text(x + w/2, y + h/2 + 0.2, label, ha='center', va='center',
                     fontsize=fontsize_main, fontweight='bold')
@@ -252,7 +341,7 @@ def create_architecture_diagram():
     # AI Pipeline (Side box) - positioned to the right
     ai_box = FancyBboxPatch((15, 5.8), 2.5, 5.5, boxstyle="round,pad=0.02,rounding_size=0.15",
                             facecolor=colors['ai'], edgecolor=colors['border'], linewidth=2)
-    ax.add_patch(ai_box)
+    patches.append(ai_box)
     ax.text(16.25, 10.8, 'AI PIPELINE', fontsize=9, fontweight='bold', ha='center', color='#1a365d')
     ax.text(16.25, 9.8, 'Intel', fontsize=8, ha='center', fontweight='bold')
     ax.text(16.25, 9.3, 'OpenVINO', fontsize=8, ha='center')
@@ -264,7 +353,7 @@ def create_architecture_diagram():
     # External Services box - positioned to the right bottom
     ext_box = FancyBboxPatch((15, 0.8), 2.5, 4.5, boxstyle="round,pad=0.02,rounding_size=0.15",
                              facecolor='#ECEFF1', edgecolor=colors['border'], linewidth=2)
-    ax.add_patch(ext_box)
+    patches.append(ext_box)
     ax.text(16.25, 4.8, 'EXTERNAL', fontsize=9, fontweight='bold', ha='center', color='#1a365d')
     ax.text(16.25, 4.3, 'SERVICES', fontsize=9, fontweight='bold', ha='center', color='#1a365d')
     ax.text(16.25, 3.5, 'Razorpay', fontsize=8, ha='center')
@@ -300,81 +389,573 @@ def create_architecture_diagram():
     ax.annotate('', xy=(15, 3.5), xytext=(14.5, 3.5),
                arrowprops=dict(arrowstyle='<->', color='#455A64', lw=1.5))
 
-    plt.tight_layout()
+    ax.add_collection(PatchCollection(patches, match_original=True))
+
+    # The figure size matches the axes limits, so the axes can fill it exactly;
+    # no tight bbox (and the extra render pass it costs) is needed
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     filepath = os.path.join(OUTPUT_DIR, 'software_architecture_diagram.png')
-    plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.savefig(filepath, dpi=150, pad_inches=0.1, facecolor='white', edgecolor='none', pil_kwargs=PNG_OPTIONS)
     plt.close()
     print(f"Created: {filepath}")
     return filepath
 
 
-def set_cell_shading(cell, color):
-    """Set background color for a table cell"""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
-
-
-def create_sow_document(data_flow_path, architecture_path):
-    """Create the Statement of Work document"""
-    doc = Document()
+_TBL_TMPL = (
+    '<w:tbl {}><w:tblPr><w:tblStyle w:val="{{}}"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{{}}</w:tblGrid>{{}}</w:tbl>'
+).format(nsdecls('w'))
+_HEADER_TC_TMPL = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{}"/><w:shd w:fill="{}"/></w:tcPr>'
+    '<w:p><w:r><w:rPr><w:b/><w:color w:val="{}"/></w:rPr><w:t{}>{}</w:t></w:r></w:p></w:tc>'
+)
+_TC_TMPL = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{}"/></w:tcPr><w:p><w:r><w:t{}>{}</w:t></w:r></w:p></w:tc>'
+
 
-    # Set document margins
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Cm(2.5)
-        section.bottom_margin = Cm(2.5)
-        section.left_margin = Cm(2.5)
-        section.right_margin = Cm(2.5)
+@functools.lru_cache(maxsize=None)
+def _row_template(widths):
+    """<w:tr> format string for one column grid: widths baked in, (xml:space, text) slots per cell"""
+    return '<w:tr>{}</w:tr>'.format(''.join(_TC_TMPL.format(width, '{}', '{}') for width in widths))
+
+
+@functools.lru_cache(maxsize=None)
+def _table_xml(style_id, col_width, headers, color, rows_data):
+    """Markup for a whole static table: bold white headers on `color`, then rows_data
 
-    # ========== COVER PAGE ==========
+    The grid and properties match what CT_Tbl.new_tbl() plus a table style
+    produce. The table data are module-level tuples, so each table's markup
+    is built once. Values are single-line text; tabs and line breaks are not
+    converted.
+    """
+    header = ''.join(
+        _HEADER_TC_TMPL.format(col_width, color, HEADER_TEXT_COLOR, _t_attrs(text), escape(text)) for text in headers
+    )
+    row_tmpl = _row_template((col_width,) * len(headers))
+    rows = ''.join(
+        row_tmpl.format(*[part for value in values for part in (_t_attrs(value), escape(value))])
+        for values in rows_data
+    )
+    grid = f'<w:gridCol w:w="{col_width}"/>' * len(headers)
+    return _TBL_TMPL.format(style_id, grid, f'<w:tr>{header}</w:tr>{rows}')
+
+
+_LABEL_BULLET_TMPL = (
+    '<w:p {}><w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{{}}</w:t></w:r>'
+    '<w:r><w:t{{}}>{{}}</w:t></w:r></w:p>'
+).format(nsdecls('w'))
+
+
+_STYLED_P_TMPL = (
+    '<w:p {}><w:pPr><w:pStyle w:val="{{}}"/></w:pPr><w:r><w:t>{{}}</w:t></w:r></w:p>'
+).format(nsdecls('w'))
+
+
+_BULLET_P_TMPL = '<w:p><w:pPr><w:pStyle w:val="ListBullet"/></w:pPr><w:r><w:t{}>{}</w:t></w:r></w:p>'
+_LABEL_P_TMPL = '<w:p><w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{}</w:t></w:r><w:r><w:t{}>{}</w:t></w:r></w:p>'
+_FRAGMENT_TMPL = '<w:body {}>{{}}</w:body>'.format(nsdecls('w'))
+
+
+def _t_attrs(text):
+    """xml:space attribute for a w:t, matching what python-docx writes"""
+    return ' xml:space="preserve"' if text != text.strip() else ''
+
+
+class AnchoredBody:
+    """Adds block content in front of a trailing anchor paragraph.
+
+    Document.add_paragraph/add_table search the body for its sectPr on every
+    call, so building a long document that way is quadratic; inserting before
+    a fixed anchor is constant time. Call finish() once to drop the anchor.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._anchor = doc.add_paragraph()
+        # Resolved once; the data tables only need its style id
+        self._table_grid = doc.styles['Table Grid']
+
+    def add_paragraph(self, text='', style=None):
+        return self._anchor.insert_paragraph_before(text, style)
+
+    def add_heading(self, text='', level=1):
+        return self.add_paragraph(text, 'Title' if level == 0 else f'Heading {level}')
+
+    def add_label_bullet(self, title, desc):
+        """Bullet with a bold 'title: ' run then desc, built as one <w:p>"""
+        p = parse_xml(_LABEL_BULLET_TMPL.format(escape(f'{title}: '), _t_attrs(desc), escape(desc)))
+        self._anchor._p.addprevious(p)
+
+    def add_bullets(self, texts):
+        """One ListBullet paragraph per text, parsed together in a single fragment"""
+        self._add_fragment(''.join(_BULLET_P_TMPL.format(_t_attrs(text), escape(text)) for text in texts))
+
+    def add_label_paragraphs(self, pairs):
+        """One paragraph per (key, value): bold 'key: ' then value, parsed together in a single fragment"""
+        self._add_fragment(''.join(
+            _LABEL_P_TMPL.format(escape(f'{key}: '), _t_attrs(value), escape(value)) for key, value in pairs
+        ))
+
+    def _add_fragment(self, paragraphs_xml):
+        for p in list(parse_xml(_FRAGMENT_TMPL.format(paragraphs_xml))):
+            self._anchor._p.addprevious(p)
+
+    def add_data_table(self, headers, color, rows_data):
+        """Table Grid table parsed in one go: header row on `color`, then one row per rows_data item"""
+        col_width = Emu(self.doc._block_width // len(headers)).twips
+        tbl = parse_xml(_table_xml(self._table_grid.style_id, col_width, headers, color, rows_data))
+        self._anchor._p.addprevious(tbl)
+        return Table(tbl, self.doc._body)
+
+    def add_page_break(self):
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def add_table(self, rows, cols):
+        tbl = CT_Tbl.new_tbl(rows, cols, self.doc._block_width)
+        self._anchor._p.addprevious(tbl)
+        return Table(tbl, self.doc._body)
+
+    def finish(self):
+        self._anchor._p.getparent().remove(self._anchor._p)
+
+
+# Section 2 feature lists: (title, description) pairs
+CORE_FEATURES = (
+    ('Multi-Venue Support', 'Organize and manage multiple parking facilities (airports, malls, hospitals, stadiums, etc.) from a single dashboard with independent configurations'),
+    ('Multi-Level Architecture', 'Support for multi-story parking structures with floor-wise and zone-wise organization'),
+    ('Zone Management', 'Create specialized zones: General, VIP, EV Charging, Disabled, Staff, Visitor, Short-term, Long-term, Two-wheeler, Valet, Reserved'),
+    ('Slot Configuration', 'Individual slot setup with type (Standard, Compact, Large, Handicapped, EV, Motorcycle, VIP, Reserved), vehicle restrictions, and visual positioning'),
+    ('Real-time Status', 'Live tracking of slot status: Available, Occupied, Reserved, Maintenance, Blocked'),
+    ('Visual Slot Mapping', 'Interactive floor plans with slot positions, rotations, and live occupancy indicators'),
+)
+
+AI_FEATURES = (
+    ('Vehicle Detection', 'Real-time detection using YOLOv8n model optimized for parking scenarios with 95%+ accuracy'),
+    ('License Plate Recognition', 'Automatic Number Plate Recognition (ANPR) supporting multiple plate formats and regions'),
+    ('Occupancy Detection', 'AI-based slot occupancy detection through bounding box matching with configurable confidence thresholds'),
+    ('Multi-Camera Support', 'Parallel processing of multiple camera feeds with Intel OpenVINO acceleration'),
+    ('Edge Processing', 'On-premise AI inference for reduced latency and enhanced privacy'),
+    ('Detection Events', 'Comprehensive logging of all detection events with timestamps, confidence scores, and associated metadata'),
+)
+
+ENTRY_FEATURES = (
+    ('Token Generation', 'Multiple token types: QR Code (auto-generated), RFID, Barcode, ANPR-based, Manual entry'),
+    ('Smart Slot Allocation', 'Intelligent algorithm considering vehicle type, zone preference, accessibility needs, and EV charging requirements'),
+    ('Gate Control Integration', 'Support for Entry, Exit, and Bidirectional gates with RS485, Relay, and API-based hardware'),
+    ('Automatic Gate Opening', 'Token validation triggers automatic gate operation with manual override capability'),
+    ('Visit History', 'Complete vehicle visit tracking with entry/exit timestamps and duration calculations'),
+)
+
+PAYMENT_FEATURES = (
+    ('Digital Wallet', 'Built-in wallet system with Personal, Business, and Merchant account types'),
+    ('Multiple Pricing Models', 'Flat Rate, Hourly (with peak multipliers), Slab-based, Dynamic pricing, Free parking options'),
+    ('Payment Methods', 'Cash, Card (Stripe), UPI (Razorpay), Wallet balance, Postpaid accounts'),
+    ('P2P Transfers', 'Peer-to-peer wallet transfers between users with transaction limits'),
+    ('Bank Integration', 'Link bank accounts for deposits/withdrawals with penny-drop verification'),
+    ('KYC Verification', 'Tiered KYC levels (None, Basic, Intermediate, Full) with corresponding transaction limits'),
+    ('Transaction Management', 'Complete transaction history with statuses: Pending, Processing, Completed, Failed, Cancelled, Reversed'),
+    ('Refund Processing', 'Automated and manual refund capabilities with audit trail'),
+)
+
+ANALYTICS_FEATURES = (
+    ('Real-time Dashboard', 'Live metrics: current occupancy, available slots, active tokens, today\'s revenue, camera status'),
+    ('Historical Analytics', 'Occupancy trends, revenue analysis, traffic patterns by hour/day/month'),
+    ('Zone Performance', 'Comparative analysis across zones with utilization metrics'),
+    ('Peak Hour Analysis', 'Identification of busiest periods for staffing and pricing optimization'),
+    ('Vehicle Distribution', 'Statistics by vehicle type and parking duration'),
+    ('Predictive Analytics', 'Occupancy forecasting based on historical patterns'),
+    ('Custom Reports', 'Export to CSV and PDF with custom date ranges and filters'),
+)
+
+USER_FEATURES = (
+    ('Role-Based Access', 'Five user roles: Super Admin, Admin, Operator, Auditor, Viewer'),
+    ('Multi-Session Support', 'Configurable concurrent session limits per user'),
+    ('Parking Lot Assignments', 'Operators can be assigned to specific facilities'),
+    ('Audit Logging', 'Comprehensive tracking of all user actions with before/after values'),
+    ('Session Security', 'IP and user agent tracking, automatic session cleanup'),
+)
+
+NOTIFICATION_FEATURES = (
+    ('Multi-Channel Delivery', 'In-app notifications, Email (SMTP/Resend/SendGrid), SMS (Twilio/MSG91)'),
+    ('Alert Rules', 'Configurable metric-based alerts with operators (GT, LT, EQ, GTE, LTE)'),
+    ('Alert Actions', 'Email, SMS, Push notifications, Webhook triggers'),
+    ('Cooldown Periods', 'Prevent alert fatigue with configurable cooldown intervals'),
+    ('Notification Types', 'Payment confirmations, session alerts, overstay warnings, system notifications'),
+)
+
+HARDWARE_FEATURES = (
+    ('Camera Support', 'RTSP and ONVIF protocol support with PTZ and IR capabilities'),
+    ('Display Integration', 'LED counters, LCD signage, kiosks, directional displays'),
+    ('Gate Systems', 'Entry/exit gates with multiple control protocols'),
+    ('Health Monitoring', 'Real-time camera status tracking (Online, Offline, Error, Maintenance)'),
+    ('Encrypted Credentials', 'Secure storage of camera and hardware credentials'),
+)
+
+
+# Section 3 technology stack tables: (category, technology, version/details) rows
+STACK_HEADERS = ('Category', 'Technology', 'Version/Details')
+FRONTEND_STACK = (
+    ('Framework', 'Next.js', '16.1.1 (App Router, Server Components)'),
+    ('UI Library', 'React', '19.2.3'),
+    ('Styling', 'Tailwind CSS', '4.0'),
+    ('Component Library', 'Radix UI', 'Full suite (15+ components)'),
+    ('Forms', 'React Hook Form + Zod', '7.69.0 / 4.2.1'),
+    ('State Management', 'Zustand', '5.0.9'),
+    ('Data Fetching', 'TanStack React Query', '5.90.12'),
+    ('Charts', 'Recharts', '2.15.4'),
+    ('Maps', 'Leaflet + React-Leaflet', '1.9.4 / 5.0.0'),
+    ('Icons', 'Lucide React', '0.562.0'),
+    ('PDF Generation', 'jsPDF + Autotable', '3.0.4'),
+    ('Real-time', 'Socket.IO Client', '4.8.3'),
+    ('Language', 'TypeScript', '5.x'),
+)
+
+BACKEND_STACK = (
+    ('Runtime', 'Node.js', 'LTS (18.x+)'),
+    ('Framework', 'Next.js API Routes', '16.1.1'),
+    ('ORM', 'Prisma', '7.2.0'),
+    ('Database', 'PostgreSQL', '16+'),
+    ('Cache', 'Redis', '7.x'),
+    ('Auth', 'jose (JWT) + bcryptjs', '6.1.3 / 3.0.3'),
+    ('Real-time', 'Socket.IO Server', '4.8.3'),
+    ('Email', 'Nodemailer', '7.0.12'),
+    ('Validation', 'Zod', '4.2.1'),
+)
+
+AI_STACK = (
+    ('Language', 'Python', '3.9+'),
+    ('Inference Engine', 'Intel OpenVINO', '2024.0.0+'),
+    ('Object Detection', 'Ultralytics YOLOv8', '8.0.0+'),
+    ('Computer Vision', 'OpenCV', '4.8.0+'),
+    ('Video Processing', 'PyAV', '10.0.0'),
+    ('Messaging', 'paho-mqtt', '1.6.1'),
+    ('HTTP Client', 'aiohttp + requests', '3.9.0 / 2.31.0'),
+    ('Geometry', 'Shapely', '2.0.0'),
+    ('Logging', 'structlog', '23.0.0'),
+)
+
+DEVOPS_STACK = (
+    ('Containerization', 'Docker', 'Latest'),
+    ('Orchestration', 'Docker Compose', 'Multi-service setup'),
+    ('Reverse Proxy', 'Nginx', 'Alpine'),
+    ('Message Broker', 'Eclipse Mosquitto', '2.x (MQTT)'),
+    ('Hosting', 'Vercel / Self-hosted', 'Serverless + Docker'),
+    ('CI/CD', 'Git-based deployment', 'Vercel auto-deploy'),
+)
+
+EXTERNAL_SERVICES = (
+    ('Payment - India', 'Razorpay', 'Cards, UPI, Wallets'),
+    ('Payment - Global', 'Stripe', 'Cards, Apple Pay, Google Pay'),
+    ('Email', 'SMTP / Resend / SendGrid', 'Transactional emails'),
+    ('SMS - India', 'MSG91', 'OTP, Notifications'),
+    ('SMS - Global', 'Twilio', 'SMS worldwide'),
+    ('Storage', 'Local / AWS S3', 'File storage'),
+)
+
+
+# Section 7 team tables
+TEAM_HEADERS = ('Role', 'Count', 'Experience', 'Key Responsibilities')
+TEAM_ROLES = (
+    ('Project Manager', '1', '5+ years', 'Project planning, stakeholder management, delivery oversight'),
+    ('Tech Lead / Architect', '1', '7+ years', 'Architecture design, technical decisions, code reviews'),
+    ('Senior Full-Stack Developer', '2', '4+ years', 'Frontend/backend development, API design, database'),
+    ('Full-Stack Developer', '2', '2+ years', 'Feature development, bug fixes, testing'),
+    ('AI/ML Engineer', '1', '3+ years', 'OpenVINO integration, model optimization, detection pipeline'),
+    ('DevOps Engineer', '1', '3+ years', 'Infrastructure, CI/CD, Docker, monitoring'),
+    ('UI/UX Designer', '1', '3+ years', 'Interface design, user experience, prototyping'),
+    ('QA Engineer', '1', '3+ years', 'Test planning, automation, quality assurance'),
+)
+
+SKILL_HEADERS = ('Area', 'Required Skills', 'Nice to Have')
+SKILLS_MATRIX = (
+    ('Frontend', 'React, Next.js, TypeScript, Tailwind CSS', 'React Query, Zustand, Radix UI'),
+    ('Backend', 'Node.js, Prisma, PostgreSQL, REST APIs', 'GraphQL, Redis, Socket.IO'),
+    ('AI/ML', 'Python, OpenCV, Deep Learning', 'OpenVINO, YOLO, MQTT'),
+    ('DevOps', 'Docker, Linux, CI/CD', 'Kubernetes, AWS, Nginx'),
+    ('Database', 'PostgreSQL, SQL optimization', 'Redis, Database design'),
+    ('Payment', 'Payment gateway integration', 'Razorpay, Stripe, PCI compliance'),
+)
+
+
+# Section 8 schedule tables
+TIMELINE_HEADERS = ('Phase', 'Description', 'Duration', 'Cumulative')
+TIMELINE_PHASES = (
+    ('Phase 1', 'Foundation & Core Infrastructure', '4 weeks', 'Week 1-4'),
+    ('Phase 2', 'Parking Management Core', '6 weeks', 'Week 5-10'),
+    ('Phase 3', 'AI Pipeline Integration', '5 weeks', 'Week 11-15'),
+    ('Phase 4', 'Payment & Wallet System', '5 weeks', 'Week 16-20'),
+    ('Phase 5', 'Real-time & Notifications', '3 weeks', 'Week 21-23'),
+    ('Phase 6', 'Analytics & Reporting', '3 weeks', 'Week 24-26'),
+    ('Phase 7', 'Public Interfaces & Testing', '3 weeks', 'Week 27-29'),
+    ('Phase 8', 'Deployment & Launch', '2 weeks', 'Week 30-31'),
+)
+
+MILESTONE_HEADERS = ('Milestone', 'Target', 'Deliverables')
+MILESTONES = (
+    ('M1: Foundation Complete', 'Week 4', 'Authentication, user management, basic UI'),
+    ('M2: Core Parking Ready', 'Week 10', 'Full parking management workflow'),
+    ('M3: AI Integration Complete', 'Week 15', 'Vehicle and plate detection operational'),
+    ('M4: Payment System Live', 'Week 20', 'All payment methods functional'),
+    ('M5: Real-time Features', 'Week 23', 'Live updates and notifications'),
+    ('M6: Analytics Dashboard', 'Week 26', 'Full reporting capabilities'),
+    ('M7: Beta Release', 'Week 29', 'Feature-complete for testing'),
+    ('M8: Production Launch', 'Week 31', 'Go-live with support'),
+)
+
+
+# Section 9 endpoint tables: (method, endpoint, description, auth required) rows
+API_HEADERS = ('Method', 'Endpoint', 'Description', 'Auth Required')
+AUTH_APIS = (
+    ('POST', '/api/auth/login', 'User login with email/password', 'No'),
+    ('POST', '/api/auth/logout', 'Terminate current session', 'Yes'),
+    ('GET', '/api/auth/me', 'Get current user details', 'Yes'),
+)
+
+LOT_APIS = (
+    ('GET', '/api/parking-lots', 'List all parking lots with stats', 'Yes'),
+    ('POST', '/api/parking-lots', 'Create new parking lot', 'Admin'),
+    ('GET', '/api/parking-lots/{id}', 'Get parking lot details', 'Yes'),
+    ('PATCH', '/api/parking-lots/{id}', 'Update parking lot', 'Admin'),
+    ('GET', '/api/parking-lots/{id}/stats', 'Real-time statistics', 'Yes'),
+)
+
+TOKEN_APIS = (
+    ('GET', '/api/tokens', 'List tokens with filters', 'Yes'),
+    ('POST', '/api/tokens', 'Create entry token', 'Yes'),
+    ('GET', '/api/tokens/{id}', 'Get token details', 'Yes'),
+    ('PATCH', '/api/tokens/{id}', 'Update token (mark exit)', 'Yes'),
+    ('DELETE', '/api/tokens/{id}', 'Cancel token', 'Admin'),
+)
+
+PAYMENT_APIS = (
+    ('GET', '/api/wallet', 'Get user wallets', 'Yes'),
+    ('POST', '/api/wallet', 'Create new wallet', 'Yes'),
+    ('GET', '/api/wallet/{id}/balance', 'Get wallet balance', 'Yes'),
+    ('POST', '/api/payments/parking', 'Pay for parking', 'Yes'),
+    ('POST', '/api/payments/deposit', 'Deposit to wallet', 'Yes'),
+    ('POST', '/api/payments/withdraw', 'Withdraw to bank', 'Yes'),
+    ('POST', '/api/payments/transfer', 'P2P transfer', 'Yes'),
+    ('GET', '/api/transactions', 'Transaction history', 'Yes'),
+)
+
+ANALYTICS_APIS = (
+    ('GET', '/api/analytics', 'Overview metrics', 'Yes'),
+    ('GET', '/api/analytics?type=occupancy', 'Occupancy trends', 'Yes'),
+    ('GET', '/api/analytics?type=revenue', 'Revenue analysis', 'Yes'),
+    ('GET', '/api/analytics?type=traffic', 'Entry/exit patterns', 'Yes'),
+    ('GET', '/api/analytics/predictive', 'Forecasting', 'Yes'),
+    ('GET', '/api/reports/export', 'Export CSV/PDF', 'Yes'),
+)
+
+REALTIME_APIS = (
+    ('POST', '/api/realtime/detection', 'AI detection event (from pipeline)', 'API Key'),
+    ('GET', '/api/cameras', 'List cameras', 'Yes'),
+    ('GET', '/api/cameras/{id}/stream', 'RTSP stream proxy', 'Yes'),
+    ('GET', '/api/metrics', 'System metrics', 'Yes'),
+    ('WS', '/socket.io', 'Real-time updates', 'Yes'),
+)
+
+
+# Section 10 model field tables: (field, type, description) rows
+FIELD_HEADERS = ('Field', 'Type', 'Description')
+ORGANIZATION_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('name', 'String', 'Organization name'),
+    ('slug', 'String @unique', 'URL-friendly identifier'),
+    ('email', 'String?', 'Contact email'),
+    ('phone', 'String?', 'Contact phone'),
+    ('address', 'String?', 'Physical address'),
+    ('logo', 'String?', 'Logo URL'),
+    ('isActive', 'Boolean @default(true)', 'Active status'),
+    ('createdAt', 'DateTime @default(now())', 'Creation timestamp'),
+    ('updatedAt', 'DateTime @updatedAt', 'Last update'),
+)
+
+USER_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('email', 'String @unique', 'Login email'),
+    ('password', 'String', 'Hashed password (bcrypt)'),
+    ('name', 'String', 'Display name'),
+    ('role', 'UserRole @default(VIEWER)', 'SUPER_ADMIN, ADMIN, OPERATOR, AUDITOR, VIEWER'),
+    ('status', 'UserStatus @default(ACTIVE)', 'ACTIVE, INACTIVE, SUSPENDED'),
+    ('organizationId', 'String?', 'Foreign key to Organization'),
+    ('maxSessions', 'Int @default(5)', 'Concurrent session limit'),
+    ('createdAt', 'DateTime @default(now())', 'Creation timestamp'),
+)
+
+PARKING_LOT_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('name', 'String', 'Parking lot name'),
+    ('type', 'VenueType', 'AIRPORT, MALL, HOSPITAL, STADIUM, etc.'),
+    ('address', 'String', 'Physical address'),
+    ('city', 'String', 'City'),
+    ('latitude', 'Float?', 'GPS latitude'),
+    ('longitude', 'Float?', 'GPS longitude'),
+    ('totalCapacity', 'Int', 'Total slot count'),
+    ('operatingHours', 'Json?', 'Operating schedule'),
+    ('contactPhone', 'String?', 'Contact number'),
+    ('isActive', 'Boolean @default(true)', 'Active status'),
+    ('organizationId', 'String', 'Foreign key to Organization'),
+)
+
+SLOT_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('slotNumber', 'String', 'Display number (e.g., A-001)'),
+    ('type', 'SlotType', 'STANDARD, COMPACT, LARGE, EV_CHARGING, etc.'),
+    ('status', 'SlotStatus @default(AVAILABLE)', 'AVAILABLE, OCCUPIED, RESERVED, MAINTENANCE'),
+    ('isOccupied', 'Boolean @default(false)', 'Quick occupancy check'),
+    ('vehicleType', 'VehicleType?', 'CAR, SUV, MOTORCYCLE, etc.'),
+    ('positionX', 'Float?', 'Visual map X coordinate'),
+    ('positionY', 'Float?', 'Visual map Y coordinate'),
+    ('rotation', 'Float? @default(0)', 'Visual rotation angle'),
+    ('hasEvCharger', 'Boolean @default(false)', 'EV charging availability'),
+    ('hasRoof', 'Boolean @default(false)', 'Covered parking'),
+    ('isAccessible', 'Boolean @default(false)', 'Handicap accessible'),
+    ('zoneId', 'String', 'Foreign key to Zone'),
+    ('parkingLotId', 'String', 'Foreign key to ParkingLot'),
+)
+
+TOKEN_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('tokenNumber', 'String @unique', 'Unique token identifier'),
+    ('type', 'TokenType', 'QR_CODE, RFID, BARCODE, ANPR, MANUAL'),
+    ('status', 'TokenStatus @default(ACTIVE)', 'ACTIVE, COMPLETED, CANCELLED, EXPIRED'),
+    ('qrCode', 'String?', 'Generated QR code data'),
+    ('licensePlate', 'String?', 'Vehicle license plate'),
+    ('entryTime', 'DateTime @default(now())', 'Entry timestamp'),
+    ('exitTime', 'DateTime?', 'Exit timestamp'),
+    ('duration', 'Int?', 'Parking duration in minutes'),
+    ('amount', 'BigInt?', 'Charged amount in paise'),
+    ('isPaid', 'Boolean @default(false)', 'Payment status'),
+    ('slotId', 'String?', 'Foreign key to Slot'),
+    ('vehicleId', 'String?', 'Foreign key to Vehicle'),
+    ('parkingLotId', 'String', 'Foreign key to ParkingLot'),
+)
+
+WALLET_FIELDS = (
+    ('id', 'String @id @default(cuid())', 'Primary key'),
+    ('type', 'WalletType', 'PERSONAL, BUSINESS, MERCHANT'),
+    ('balance', 'BigInt @default(0)', 'Balance in paise (smallest unit)'),
+    ('currency', 'String @default("INR")', 'Currency code'),
+    ('isActive', 'Boolean @default(true)', 'Active status'),
+    ('kycLevel', 'KycLevel @default(NONE)', 'NONE, BASIC, INTERMEDIATE, FULL'),
+    ('dailyLimit', 'BigInt?', 'Daily transaction limit'),
+    ('monthlyLimit', 'BigInt?', 'Monthly transaction limit'),
+    ('perTransactionLimit', 'BigInt?', 'Single transaction limit'),
+    ('userId', 'String?', 'Foreign key to User'),
+    ('parkingLotId', 'String?', 'Foreign key (for merchant wallets)'),
+)
+
+
+# Section 10 schema summary lists
+SCHEMA_STATS = (
+    ('Total Models', '27'),
+    ('Total Fields', '250+'),
+    ('Primary Database', 'PostgreSQL 16'),
+    ('ORM', 'Prisma 7.2.0'),
+    ('ID Strategy', 'CUID (collision-resistant unique identifiers)'),
+)
+
+MODEL_RELATIONSHIPS = (
+    'Organization → Users, ParkingLots, Settings (one-to-many)',
+    'ParkingLot → Zones, Slots, Tokens, Cameras, Gates, Displays (one-to-many)',
+    'Zone → Slots, PricingRules (one-to-many)',
+    'Slot → SlotOccupancy, Tokens (one-to-many)',
+    'User → Sessions, Wallets, AuditLogs, ParkingLotAssignments (one-to-many)',
+    'Token → Transaction, Vehicle, Slot (many-to-one)',
+    'Wallet → WalletTransactions, BankAccounts, Payments (one-to-many)',
+    'Camera → DetectionEvents (one-to-many)',
+)
+
+MODEL_INDEXES = (
+    ('Slot', 'parkingLotId, zoneId, status, isOccupied'),
+    ('Token', 'parkingLotId, status, entryTime, licensePlate'),
+    ('WalletTransaction', 'walletId, type, status, createdAt'),
+    ('DetectionEvent', 'cameraId, type, timestamp'),
+    ('AuditLog', 'userId, entityType, createdAt'),
+)
+
+
+# Document information footer: (label, value) pairs
+DOCUMENT_INFO = (
+    ('Document Version', '1.0'),
+    ('Created Date', 'January 2026'),
+    ('Last Updated', 'January 2026'),
+    ('Prepared By', 'Development Team'),
+    ('Confidentiality', 'This document contains proprietary information.'),
+)
+
+
+# Blank-document package, captured on first use so later builds skip
+# re-reading and re-parsing python-docx's default template
+_BASE_DOC_BYTES = None
+
+
+def new_document():
+    """Return a fresh blank Document built from the cached base package"""
+    global _BASE_DOC_BYTES
+    if _BASE_DOC_BYTES is None:
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        _BASE_DOC_BYTES = buffer.getvalue()
+    return Document(io.BytesIO(_BASE_DOC_BYTES))
+
+
+def _build_cover(body):
+    """Cover page"""
     # Add spacing before title
     for _ in range(6):
-        doc.add_paragraph()
+        body.add_paragraph()
 
     # Title
-    title = doc.add_paragraph()
+    title = body.add_paragraph()
     title_run = title.add_run('STATEMENT OF WORK')
     title_run.bold = True
-    title_run.font.size = Pt(28)
-    title_run.font.color.rgb = RGBColor(26, 54, 93)
+    title_run.font.size = TITLE_PT
+    title_run.font.color.rgb = TITLE_COLOR
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Subtitle
-    subtitle = doc.add_paragraph()
+    subtitle = body.add_paragraph()
     subtitle_run = subtitle.add_run('SPARKING')
     subtitle_run.bold = True
-    subtitle_run.font.size = Pt(36)
-    subtitle_run.font.color.rgb = RGBColor(46, 125, 50)
+    subtitle_run.font.size = SUBTITLE_PT
+    subtitle_run.font.color.rgb = SUBTITLE_COLOR
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Tagline
-    tagline = doc.add_paragraph()
+    tagline = body.add_paragraph()
     tagline_run = tagline.add_run('AI-Powered Smart Parking Management System')
-    tagline_run.font.size = Pt(16)
-    tagline_run.font.color.rgb = RGBColor(97, 97, 97)
+    tagline_run.font.size = TAGLINE_PT
+    tagline_run.font.color.rgb = TAGLINE_COLOR
     tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Add spacing
     for _ in range(4):
-        doc.add_paragraph()
+        body.add_paragraph()
 
     # Version info
-    version_para = doc.add_paragraph()
+    version_para = body.add_paragraph()
     version_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     version_run = version_para.add_run('Version 1.0\nJanuary 2026')
-    version_run.font.size = Pt(12)
-    version_run.font.color.rgb = RGBColor(117, 117, 117)
+    version_run.font.size = BODY_PT
+    version_run.font.color.rgb = VERSION_COLOR
 
     # Page break
-    doc.add_page_break()
+    body.add_page_break()
+
 
-    # ========== TABLE OF CONTENTS ==========
-    toc_heading = doc.add_heading('Table of Contents', level=1)
+def _build_toc(body):
+    """Table of contents"""
+    toc_heading = body.add_heading('Table of Contents', level=1)
     toc_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Add some spacing after heading
-    doc.add_paragraph()
+    body.add_paragraph()
 
     toc_items = [
         ('1.', 'Executive Summary', '3'),
@@ -390,47 +971,52 @@ def create_sow_document(data_flow_path, architecture_path):
     ]
 
     # Create a properly formatted TOC table with column widths
-    toc_table = doc.add_table(rows=len(toc_items), cols=3)
+    toc_table = body.add_table(rows=len(toc_items), cols=3)
     toc_table.autofit = False
 
+    # Flat row-major list of cells; Table.rows[i].cells rebuilds the whole grid per access
+    toc_cells = toc_table._cells
+
     # Set column widths (number, title, page)
-    for row in toc_table.rows:
-        row.cells[0].width = Cm(1.5)
-        row.cells[1].width = Cm(12)
-        row.cells[2].width = Cm(2)
-
-    for i, (num, title, page) in enumerate(toc_items):
-        row = toc_table.rows[i]
-
-        # Section number - left aligned, bold
-        cell0 = row.cells[0]
-        cell0.text = num
-        cell0.paragraphs[0].runs[0].font.bold = True
-        cell0.paragraphs[0].runs[0].font.size = Pt(12)
-        cell0.vertical_alignment = 1  # CENTER
-
-        # Title - left aligned
-        cell1 = row.cells[1]
-        cell1.text = title
-        cell1.paragraphs[0].runs[0].font.size = Pt(12)
-        cell1.vertical_alignment = 1  # CENTER
-
-        # Page number - right aligned
-        cell2 = row.cells[2]
-        cell2.text = page
-        cell2.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        cell2.paragraphs[0].runs[0].font.size = Pt(12)
-        cell2.vertical_alignment = 1  # CENTER
-
-        # Add spacing between rows
-        for cell in row.cells:
-            cell.paragraphs[0].paragraph_format.space_before = Pt(6)
-            cell.paragraphs[0].paragraph_format.space_after = Pt(6)
-
-    doc.add_page_break()
-
-    # ========== 1. EXECUTIVE SUMMARY ==========
-    doc.add_heading('1. Executive Summary', level=1)
+    for i in range(len(toc_items)):
+        toc_cells[i * 3].width = TOC_NUMBER_WIDTH
+        toc_cells[i * 3 + 1].width = TOC_TITLE_WIDTH
+        toc_cells[i * 3 + 2].width = TOC_PAGE_WIDTH
+
+    # Row formatting (12pt, 6pt spacing between rows) lives in one paragraph
+    # style per column rather than being set on every run and paragraph
+    def add_toc_style(name, bold=False, alignment=None):
+        style = body.doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = body.doc.styles['Normal']
+        style.font.size = BODY_PT
+        style.font.bold = bold
+        style.paragraph_format.space_before = TOC_ROW_GAP
+        style.paragraph_format.space_after = TOC_ROW_GAP
+        if alignment is not None:
+            style.paragraph_format.alignment = alignment
+        return style
+
+    # Section number - left aligned, bold; title - left aligned; page number - right aligned
+    toc_styles = (
+        add_toc_style('TOC Number', bold=True),
+        add_toc_style('TOC Title'),
+        add_toc_style('TOC Page', alignment=WD_ALIGN_PARAGRAPH.RIGHT),
+    )
+
+    for i, row_text in enumerate(toc_items):
+        for j, (text, style) in enumerate(zip(row_text, toc_styles)):
+            cell = toc_cells[i * 3 + j]
+            # Swap the cell's empty paragraph for a fully built one
+            tc = cell._tc
+            tc.replace(tc.p_lst[0], parse_xml(_STYLED_P_TMPL.format(style.style_id, escape(text))))
+            cell.vertical_alignment = 1  # CENTER
+
+    body.add_page_break()
+
+
+def _build_executive_summary(body):
+    """1. Executive Summary"""
+    body.add_heading('1. Executive Summary', level=1)
 
     exec_summary = """
 SPARKING is a comprehensive, enterprise-grade Smart Parking Management System designed to revolutionize parking facility operations through artificial intelligence and real-time monitoring. The system combines cutting-edge computer vision technology with a robust payment infrastructure to deliver a seamless parking experience for both operators and end-users.
@@ -460,324 +1046,115 @@ Key Differentiators:
 """
 
     for para in exec_summary.strip().split('\n\n'):
-        p = doc.add_paragraph(para.strip())
-        p.paragraph_format.space_after = Pt(12)
+        p = body.add_paragraph(para.strip())
+        p.paragraph_format.space_after = PARAGRAPH_GAP
 
-    doc.add_page_break()
+    body.add_page_break()
 
-    # ========== 2. FEATURE LIST ==========
-    doc.add_heading('2. Feature List', level=1)
+
+def _build_feature_list(body):
+    """2. Feature List"""
+    body.add_heading('2. Feature List', level=1)
 
     # 2.1 Core Parking Management
-    doc.add_heading('2.1 Core Parking Management', level=2)
-
-    core_features = [
-        ('Multi-Venue Support', 'Organize and manage multiple parking facilities (airports, malls, hospitals, stadiums, etc.) from a single dashboard with independent configurations'),
-        ('Multi-Level Architecture', 'Support for multi-story parking structures with floor-wise and zone-wise organization'),
-        ('Zone Management', 'Create specialized zones: General, VIP, EV Charging, Disabled, Staff, Visitor, Short-term, Long-term, Two-wheeler, Valet, Reserved'),
-        ('Slot Configuration', 'Individual slot setup with type (Standard, Compact, Large, Handicapped, EV, Motorcycle, VIP, Reserved), vehicle restrictions, and visual positioning'),
-        ('Real-time Status', 'Live tracking of slot status: Available, Occupied, Reserved, Maintenance, Blocked'),
-        ('Visual Slot Mapping', 'Interactive floor plans with slot positions, rotations, and live occupancy indicators'),
-    ]
+    body.add_heading('2.1 Core Parking Management', level=2)
 
-    for title, desc in core_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in CORE_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.2 AI-Powered Detection
-    doc.add_heading('2.2 AI-Powered Detection', level=2)
-
-    ai_features = [
-        ('Vehicle Detection', 'Real-time detection using YOLOv8n model optimized for parking scenarios with 95%+ accuracy'),
-        ('License Plate Recognition', 'Automatic Number Plate Recognition (ANPR) supporting multiple plate formats and regions'),
-        ('Occupancy Detection', 'AI-based slot occupancy detection through bounding box matching with configurable confidence thresholds'),
-        ('Multi-Camera Support', 'Parallel processing of multiple camera feeds with Intel OpenVINO acceleration'),
-        ('Edge Processing', 'On-premise AI inference for reduced latency and enhanced privacy'),
-        ('Detection Events', 'Comprehensive logging of all detection events with timestamps, confidence scores, and associated metadata'),
-    ]
+    body.add_heading('2.2 AI-Powered Detection', level=2)
 
-    for title, desc in ai_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in AI_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.3 Entry/Exit Management
-    doc.add_heading('2.3 Entry/Exit Management', level=2)
-
-    entry_features = [
-        ('Token Generation', 'Multiple token types: QR Code (auto-generated), RFID, Barcode, ANPR-based, Manual entry'),
-        ('Smart Slot Allocation', 'Intelligent algorithm considering vehicle type, zone preference, accessibility needs, and EV charging requirements'),
-        ('Gate Control Integration', 'Support for Entry, Exit, and Bidirectional gates with RS485, Relay, and API-based hardware'),
-        ('Automatic Gate Opening', 'Token validation triggers automatic gate operation with manual override capability'),
-        ('Visit History', 'Complete vehicle visit tracking with entry/exit timestamps and duration calculations'),
-    ]
+    body.add_heading('2.3 Entry/Exit Management', level=2)
 
-    for title, desc in entry_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in ENTRY_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.4 Payment & Wallet System
-    doc.add_heading('2.4 Payment & Wallet System', level=2)
-
-    payment_features = [
-        ('Digital Wallet', 'Built-in wallet system with Personal, Business, and Merchant account types'),
-        ('Multiple Pricing Models', 'Flat Rate, Hourly (with peak multipliers), Slab-based, Dynamic pricing, Free parking options'),
-        ('Payment Methods', 'Cash, Card (Stripe), UPI (Razorpay), Wallet balance, Postpaid accounts'),
-        ('P2P Transfers', 'Peer-to-peer wallet transfers between users with transaction limits'),
-        ('Bank Integration', 'Link bank accounts for deposits/withdrawals with penny-drop verification'),
-        ('KYC Verification', 'Tiered KYC levels (None, Basic, Intermediate, Full) with corresponding transaction limits'),
-        ('Transaction Management', 'Complete transaction history with statuses: Pending, Processing, Completed, Failed, Cancelled, Reversed'),
-        ('Refund Processing', 'Automated and manual refund capabilities with audit trail'),
-    ]
+    body.add_heading('2.4 Payment & Wallet System', level=2)
 
-    for title, desc in payment_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in PAYMENT_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.5 Analytics & Reporting
-    doc.add_heading('2.5 Analytics & Reporting', level=2)
-
-    analytics_features = [
-        ('Real-time Dashboard', 'Live metrics: current occupancy, available slots, active tokens, today\'s revenue, camera status'),
-        ('Historical Analytics', 'Occupancy trends, revenue analysis, traffic patterns by hour/day/month'),
-        ('Zone Performance', 'Comparative analysis across zones with utilization metrics'),
-        ('Peak Hour Analysis', 'Identification of busiest periods for staffing and pricing optimization'),
-        ('Vehicle Distribution', 'Statistics by vehicle type and parking duration'),
-        ('Predictive Analytics', 'Occupancy forecasting based on historical patterns'),
-        ('Custom Reports', 'Export to CSV and PDF with custom date ranges and filters'),
-    ]
+    body.add_heading('2.5 Analytics & Reporting', level=2)
 
-    for title, desc in analytics_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in ANALYTICS_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.6 User Management
-    doc.add_heading('2.6 User Management & Access Control', level=2)
-
-    user_features = [
-        ('Role-Based Access', 'Five user roles: Super Admin, Admin, Operator, Auditor, Viewer'),
-        ('Multi-Session Support', 'Configurable concurrent session limits per user'),
-        ('Parking Lot Assignments', 'Operators can be assigned to specific facilities'),
-        ('Audit Logging', 'Comprehensive tracking of all user actions with before/after values'),
-        ('Session Security', 'IP and user agent tracking, automatic session cleanup'),
-    ]
+    body.add_heading('2.6 User Management & Access Control', level=2)
 
-    for title, desc in user_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in USER_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.7 Notifications & Alerts
-    doc.add_heading('2.7 Notifications & Alerts', level=2)
-
-    notification_features = [
-        ('Multi-Channel Delivery', 'In-app notifications, Email (SMTP/Resend/SendGrid), SMS (Twilio/MSG91)'),
-        ('Alert Rules', 'Configurable metric-based alerts with operators (GT, LT, EQ, GTE, LTE)'),
-        ('Alert Actions', 'Email, SMS, Push notifications, Webhook triggers'),
-        ('Cooldown Periods', 'Prevent alert fatigue with configurable cooldown intervals'),
-        ('Notification Types', 'Payment confirmations, session alerts, overstay warnings, system notifications'),
-    ]
+    body.add_heading('2.7 Notifications & Alerts', level=2)
 
-    for title, desc in notification_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+    for title, desc in NOTIFICATION_FEATURES:
+        body.add_label_bullet(title, desc)
 
     # 2.8 Hardware Integration
-    doc.add_heading('2.8 Hardware Integration', level=2)
-
-    hardware_features = [
-        ('Camera Support', 'RTSP and ONVIF protocol support with PTZ and IR capabilities'),
-        ('Display Integration', 'LED counters, LCD signage, kiosks, directional displays'),
-        ('Gate Systems', 'Entry/exit gates with multiple control protocols'),
-        ('Health Monitoring', 'Real-time camera status tracking (Online, Offline, Error, Maintenance)'),
-        ('Encrypted Credentials', 'Secure storage of camera and hardware credentials'),
-    ]
+    body.add_heading('2.8 Hardware Integration', level=2)
 
-    for title, desc in hardware_features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
-
-    doc.add_page_break()
-
-    # ========== 3. TECHNOLOGY STACK ==========
-    doc.add_heading('3. Technology Stack', level=1)
-
-    # Frontend
-    doc.add_heading('3.1 Frontend Technologies', level=2)
-
-    frontend_table = doc.add_table(rows=1, cols=3)
-    frontend_table.style = 'Table Grid'
-
-    header_cells = frontend_table.rows[0].cells
-    headers = ['Category', 'Technology', 'Version/Details']
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '1a365d')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    frontend_data = [
-        ('Framework', 'Next.js', '16.1.1 (App Router, Server Components)'),
-        ('UI Library', 'React', '19.2.3'),
-        ('Styling', 'Tailwind CSS', '4.0'),
-        ('Component Library', 'Radix UI', 'Full suite (15+ components)'),
-        ('Forms', 'React Hook Form + Zod', '7.69.0 / 4.2.1'),
-        ('State Management', 'Zustand', '5.0.9'),
-        ('Data Fetching', 'TanStack React Query', '5.90.12'),
-        ('Charts', 'Recharts', '2.15.4'),
-        ('Maps', 'Leaflet + React-Leaflet', '1.9.4 / 5.0.0'),
-        ('Icons', 'Lucide React', '0.562.0'),
-        ('PDF Generation', 'jsPDF + Autotable', '3.0.4'),
-        ('Real-time', 'Socket.IO Client', '4.8.3'),
-        ('Language', 'TypeScript', '5.x'),
-    ]
+    for title, desc in HARDWARE_FEATURES:
+        body.add_label_bullet(title, desc)
 
-    for category, tech, version in frontend_data:
-        row = frontend_table.add_row()
-        row.cells[0].text = category
-        row.cells[1].text = tech
-        row.cells[2].text = version
-
-    # Backend
-    doc.add_heading('3.2 Backend Technologies', level=2)
-
-    backend_table = doc.add_table(rows=1, cols=3)
-    backend_table.style = 'Table Grid'
-
-    header_cells = backend_table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '2e7d32')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    backend_data = [
-        ('Runtime', 'Node.js', 'LTS (18.x+)'),
-        ('Framework', 'Next.js API Routes', '16.1.1'),
-        ('ORM', 'Prisma', '7.2.0'),
-        ('Database', 'PostgreSQL', '16+'),
-        ('Cache', 'Redis', '7.x'),
-        ('Auth', 'jose (JWT) + bcryptjs', '6.1.3 / 3.0.3'),
-        ('Real-time', 'Socket.IO Server', '4.8.3'),
-        ('Email', 'Nodemailer', '7.0.12'),
-        ('Validation', 'Zod', '4.2.1'),
-    ]
+    body.add_page_break()
 
-    for category, tech, version in backend_data:
-        row = backend_table.add_row()
-        row.cells[0].text = category
-        row.cells[1].text = tech
-        row.cells[2].text = version
-
-    # AI Pipeline
-    doc.add_heading('3.3 AI/ML Pipeline', level=2)
-
-    ai_table = doc.add_table(rows=1, cols=3)
-    ai_table.style = 'Table Grid'
-
-    header_cells = ai_table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '6a1b9a')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    ai_data = [
-        ('Language', 'Python', '3.9+'),
-        ('Inference Engine', 'Intel OpenVINO', '2024.0.0+'),
-        ('Object Detection', 'Ultralytics YOLOv8', '8.0.0+'),
-        ('Computer Vision', 'OpenCV', '4.8.0+'),
-        ('Video Processing', 'PyAV', '10.0.0'),
-        ('Messaging', 'paho-mqtt', '1.6.1'),
-        ('HTTP Client', 'aiohttp + requests', '3.9.0 / 2.31.0'),
-        ('Geometry', 'Shapely', '2.0.0'),
-        ('Logging', 'structlog', '23.0.0'),
-    ]
 
-    for category, tech, version in ai_data:
-        row = ai_table.add_row()
-        row.cells[0].text = category
-        row.cells[1].text = tech
-        row.cells[2].text = version
-
-    # DevOps
-    doc.add_heading('3.4 DevOps & Infrastructure', level=2)
-
-    devops_table = doc.add_table(rows=1, cols=3)
-    devops_table.style = 'Table Grid'
-
-    header_cells = devops_table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], 'e65100')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    devops_data = [
-        ('Containerization', 'Docker', 'Latest'),
-        ('Orchestration', 'Docker Compose', 'Multi-service setup'),
-        ('Reverse Proxy', 'Nginx', 'Alpine'),
-        ('Message Broker', 'Eclipse Mosquitto', '2.x (MQTT)'),
-        ('Hosting', 'Vercel / Self-hosted', 'Serverless + Docker'),
-        ('CI/CD', 'Git-based deployment', 'Vercel auto-deploy'),
-    ]
+def _build_technology_stack(body):
+    """3. Technology Stack"""
+    body.add_heading('3. Technology Stack', level=1)
 
-    for category, tech, version in devops_data:
-        row = devops_table.add_row()
-        row.cells[0].text = category
-        row.cells[1].text = tech
-        row.cells[2].text = version
-
-    # External Services
-    doc.add_heading('3.5 External Services & Integrations', level=2)
-
-    services_table = doc.add_table(rows=1, cols=3)
-    services_table.style = 'Table Grid'
-
-    header_cells = services_table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '00695c')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    services_data = [
-        ('Payment - India', 'Razorpay', 'Cards, UPI, Wallets'),
-        ('Payment - Global', 'Stripe', 'Cards, Apple Pay, Google Pay'),
-        ('Email', 'SMTP / Resend / SendGrid', 'Transactional emails'),
-        ('SMS - India', 'MSG91', 'OTP, Notifications'),
-        ('SMS - Global', 'Twilio', 'SMS worldwide'),
-        ('Storage', 'Local / AWS S3', 'File storage'),
-    ]
+    # One heading + table per stack area: (heading, header color, rows)
+    for heading, color, rows_data in (
+        ('3.1 Frontend Technologies', '1a365d', FRONTEND_STACK),
+        ('3.2 Backend Technologies', '2e7d32', BACKEND_STACK),
+        ('3.3 AI/ML Pipeline', '6a1b9a', AI_STACK),
+        ('3.4 DevOps & Infrastructure', 'e65100', DEVOPS_STACK),
+        ('3.5 External Services & Integrations', '00695c', EXTERNAL_SERVICES),
+    ):
+        body.add_heading(heading, level=2)
+        body.add_data_table(STACK_HEADERS, color, rows_data)
+
+    body.add_page_break()
+
+
+@functools.lru_cache(maxsize=None)
+def _diagram_bytes(path, mtime_ns):
+    with open(path, 'rb') as f:
+        return f.read()
 
-    for category, tech, version in services_data:
-        row = services_table.add_row()
-        row.cells[0].text = category
-        row.cells[1].text = tech
-        row.cells[2].text = version
 
-    doc.add_page_break()
+def add_diagram(paragraph, path):
+    """Add the PNG at `path` to `paragraph`; its bytes are read once per file version"""
+    stream = io.BytesIO(_diagram_bytes(path, os.stat(path).st_mtime_ns))
+    shape = paragraph.add_run().add_picture(stream, width=DIAGRAM_WIDTH)
+    # A stream has no filename, so restore the name add_picture(path) would record
+    shape._inline.graphic.graphicData.pic.nvPicPr.cNvPr.name = os.path.basename(path)
+    return shape
 
-    # ========== 4. DATA FLOW DIAGRAM ==========
-    doc.add_heading('4. Data Flow Diagram', level=1)
 
-    p = doc.add_paragraph()
+def _build_data_flow(body, data_flow_path):
+    """4. Data Flow Diagram"""
+    body.add_heading('4. Data Flow Diagram', level=1)
+
+    p = body.add_paragraph()
     p.add_run('The following diagram illustrates the flow of data through the SPARKING system, showing how information moves between external entities, processes, and data stores.')
-    p.paragraph_format.space_after = Pt(12)
+    p.paragraph_format.space_after = PARAGRAPH_GAP
 
     # Add the data flow diagram
-    doc.add_picture(data_flow_path, width=Inches(6.5))
-    last_paragraph = doc.paragraphs[-1]
+    last_paragraph = body.add_paragraph()
+    add_diagram(last_paragraph, data_flow_path)
     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Diagram explanation
-    doc.add_heading('4.1 Data Flow Description', level=2)
+    body.add_heading('4.1 Data Flow Description', level=2)
 
     flow_descriptions = [
         ('Entry Flow', 'Vehicle arrives → Camera detects vehicle/plate → Token generated → Slot allocated → Gate opens → Occupancy updated'),
@@ -788,26 +1165,26 @@ Key Differentiators:
     ]
 
     for title, desc in flow_descriptions:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+        body.add_label_bullet(title, desc)
+
+    body.add_page_break()
 
-    doc.add_page_break()
 
-    # ========== 5. SOFTWARE ARCHITECTURE ==========
-    doc.add_heading('5. Software Architecture', level=1)
+def _build_architecture(body, architecture_path):
+    """5. Software Architecture"""
+    body.add_heading('5. Software Architecture', level=1)
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('SPARKING follows a layered architecture pattern with clear separation of concerns. The diagram below shows the system\'s architectural components and their relationships.')
-    p.paragraph_format.space_after = Pt(12)
+    p.paragraph_format.space_after = PARAGRAPH_GAP
 
     # Add the architecture diagram
-    doc.add_picture(architecture_path, width=Inches(6.5))
-    last_paragraph = doc.paragraphs[-1]
+    last_paragraph = body.add_paragraph()
+    add_diagram(last_paragraph, architecture_path)
     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Architecture explanation
-    doc.add_heading('5.1 Architecture Layers', level=2)
+    body.add_heading('5.1 Architecture Layers', level=2)
 
     layers = [
         ('Client Layer', 'Web dashboard, public kiosk interface, vehicle finder portal, and admin panel built with React/Next.js'),
@@ -819,18 +1196,18 @@ Key Differentiators:
     ]
 
     for title, desc in layers:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(desc)
+        body.add_label_bullet(title, desc)
+
+    body.add_page_break()
 
-    doc.add_page_break()
 
-    # ========== 6. PLAN OF ACTION ==========
-    doc.add_heading('6. Plan of Action (Phase-wise Development)', level=1)
+def _build_plan_of_action(body):
+    """6. Plan of Action"""
+    body.add_heading('6. Plan of Action (Phase-wise Development)', level=1)
 
     # Phase 1
-    doc.add_heading('Phase 1: Foundation & Core Infrastructure', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 1: Foundation & Core Infrastructure', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 4 Weeks').bold = True
 
     phase1_tasks = [
@@ -843,14 +1220,13 @@ Key Differentiators:
         'CI/CD pipeline setup with Vercel',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase1_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase1_tasks)
 
     # Phase 2
-    doc.add_heading('Phase 2: Parking Management Core', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 2: Parking Management Core', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 6 Weeks').bold = True
 
     phase2_tasks = [
@@ -864,14 +1240,13 @@ Key Differentiators:
         'Display board integration',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase2_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase2_tasks)
 
     # Phase 3
-    doc.add_heading('Phase 3: AI Pipeline Integration', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 3: AI Pipeline Integration', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 5 Weeks').bold = True
 
     phase3_tasks = [
@@ -885,14 +1260,13 @@ Key Differentiators:
         'AI-to-backend communication via secure API',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase3_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase3_tasks)
 
     # Phase 4
-    doc.add_heading('Phase 4: Payment & Wallet System', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 4: Payment & Wallet System', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 5 Weeks').bold = True
 
     phase4_tasks = [
@@ -908,14 +1282,13 @@ Key Differentiators:
         'Refund processing',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase4_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase4_tasks)
 
     # Phase 5
-    doc.add_heading('Phase 5: Real-time & Notifications', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 5: Real-time & Notifications', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 3 Weeks').bold = True
 
     phase5_tasks = [
@@ -928,14 +1301,13 @@ Key Differentiators:
         'Webhook support for external integrations',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase5_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase5_tasks)
 
     # Phase 6
-    doc.add_heading('Phase 6: Analytics & Reporting', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 6: Analytics & Reporting', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 3 Weeks').bold = True
 
     phase6_tasks = [
@@ -948,14 +1320,13 @@ Key Differentiators:
         'Predictive analytics foundation',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase6_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase6_tasks)
 
     # Phase 7
-    doc.add_heading('Phase 7: Public Interfaces & Testing', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 7: Public Interfaces & Testing', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 3 Weeks').bold = True
 
     phase7_tasks = [
@@ -968,14 +1339,13 @@ Key Differentiators:
         'Bug fixes and refinements',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase7_tasks:
-        doc.add_paragraph(task, style='List Bullet')
+    body.add_bullets(phase7_tasks)
 
     # Phase 8
-    doc.add_heading('Phase 8: Deployment & Launch', level=2)
-    p = doc.add_paragraph()
+    body.add_heading('Phase 8: Deployment & Launch', level=2)
+    p = body.add_paragraph()
     p.add_run('Duration: 2 Weeks').bold = True
 
     phase8_tasks = [
@@ -988,78 +1358,28 @@ Key Differentiators:
         'Go-live support and stabilization',
     ]
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('Deliverables:').bold = True
-    for task in phase8_tasks:
-        doc.add_paragraph(task, style='List Bullet')
-
-    doc.add_page_break()
-
-    # ========== 7. TEAM SETUP ==========
-    doc.add_heading('7. Required Team Setup', level=1)
-
-    doc.add_heading('7.1 Core Development Team', level=2)
-
-    team_table = doc.add_table(rows=1, cols=4)
-    team_table.style = 'Table Grid'
-
-    header_cells = team_table.rows[0].cells
-    team_headers = ['Role', 'Count', 'Experience', 'Key Responsibilities']
-    for i, header in enumerate(team_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '1a365d')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    team_data = [
-        ('Project Manager', '1', '5+ years', 'Project planning, stakeholder management, delivery oversight'),
-        ('Tech Lead / Architect', '1', '7+ years', 'Architecture design, technical decisions, code reviews'),
-        ('Senior Full-Stack Developer', '2', '4+ years', 'Frontend/backend development, API design, database'),
-        ('Full-Stack Developer', '2', '2+ years', 'Feature development, bug fixes, testing'),
-        ('AI/ML Engineer', '1', '3+ years', 'OpenVINO integration, model optimization, detection pipeline'),
-        ('DevOps Engineer', '1', '3+ years', 'Infrastructure, CI/CD, Docker, monitoring'),
-        ('UI/UX Designer', '1', '3+ years', 'Interface design, user experience, prototyping'),
-        ('QA Engineer', '1', '3+ years', 'Test planning, automation, quality assurance'),
-    ]
+    body.add_bullets(phase8_tasks)
 
-    for role, count, exp, resp in team_data:
-        row = team_table.add_row()
-        row.cells[0].text = role
-        row.cells[1].text = count
-        row.cells[2].text = exp
-        row.cells[3].text = resp
-
-    doc.add_heading('7.2 Required Skills Matrix', level=2)
-
-    skills_table = doc.add_table(rows=1, cols=3)
-    skills_table.style = 'Table Grid'
-
-    header_cells = skills_table.rows[0].cells
-    skill_headers = ['Area', 'Required Skills', 'Nice to Have']
-    for i, header in enumerate(skill_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '2e7d32')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    skills_data = [
-        ('Frontend', 'React, Next.js, TypeScript, Tailwind CSS', 'React Query, Zustand, Radix UI'),
-        ('Backend', 'Node.js, Prisma, PostgreSQL, REST APIs', 'GraphQL, Redis, Socket.IO'),
-        ('AI/ML', 'Python, OpenCV, Deep Learning', 'OpenVINO, YOLO, MQTT'),
-        ('DevOps', 'Docker, Linux, CI/CD', 'Kubernetes, AWS, Nginx'),
-        ('Database', 'PostgreSQL, SQL optimization', 'Redis, Database design'),
-        ('Payment', 'Payment gateway integration', 'Razorpay, Stripe, PCI compliance'),
-    ]
+    body.add_page_break()
 
-    for area, required, nice in skills_data:
-        row = skills_table.add_row()
-        row.cells[0].text = area
-        row.cells[1].text = required
-        row.cells[2].text = nice
 
-    doc.add_heading('7.3 Team Structure', level=2)
+def _build_team_setup(body):
+    """7. Team Setup"""
+    body.add_heading('7. Required Team Setup', level=1)
 
-    p = doc.add_paragraph()
+    body.add_heading('7.1 Core Development Team', level=2)
+
+    body.add_data_table(TEAM_HEADERS, '1a365d', TEAM_ROLES)
+
+    body.add_heading('7.2 Required Skills Matrix', level=2)
+
+    body.add_data_table(SKILL_HEADERS, '2e7d32', SKILLS_MATRIX)
+
+    body.add_heading('7.3 Team Structure', level=2)
+
+    p = body.add_paragraph()
     p.add_run('Total Team Size: 10 members').bold = True
 
     structure_items = [
@@ -1070,89 +1390,39 @@ Key Differentiators:
         'DevOps support throughout with focus on Phases 1 and 8',
     ]
 
-    for item in structure_items:
-        doc.add_paragraph(item, style='List Bullet')
+    body.add_bullets(structure_items)
 
-    doc.add_page_break()
+    body.add_page_break()
 
-    # ========== 8. TIMELINE ==========
-    doc.add_heading('8. Project Timeline', level=1)
 
-    doc.add_heading('8.1 Overall Timeline Summary', level=2)
+def _build_timeline(body):
+    """8. Timeline"""
+    body.add_heading('8. Project Timeline', level=1)
 
-    p = doc.add_paragraph()
+    body.add_heading('8.1 Overall Timeline Summary', level=2)
+
+    p = body.add_paragraph()
     p.add_run('Total Project Duration: 31 Weeks (~8 Months)').bold = True
-    p.paragraph_format.space_after = Pt(12)
-
-    timeline_table = doc.add_table(rows=1, cols=4)
-    timeline_table.style = 'Table Grid'
-
-    header_cells = timeline_table.rows[0].cells
-    timeline_headers = ['Phase', 'Description', 'Duration', 'Cumulative']
-    for i, header in enumerate(timeline_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '1a365d')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    timeline_data = [
-        ('Phase 1', 'Foundation & Core Infrastructure', '4 weeks', 'Week 1-4'),
-        ('Phase 2', 'Parking Management Core', '6 weeks', 'Week 5-10'),
-        ('Phase 3', 'AI Pipeline Integration', '5 weeks', 'Week 11-15'),
-        ('Phase 4', 'Payment & Wallet System', '5 weeks', 'Week 16-20'),
-        ('Phase 5', 'Real-time & Notifications', '3 weeks', 'Week 21-23'),
-        ('Phase 6', 'Analytics & Reporting', '3 weeks', 'Week 24-26'),
-        ('Phase 7', 'Public Interfaces & Testing', '3 weeks', 'Week 27-29'),
-        ('Phase 8', 'Deployment & Launch', '2 weeks', 'Week 30-31'),
-    ]
+    p.paragraph_format.space_after = PARAGRAPH_GAP
 
-    for phase, desc, duration, cumulative in timeline_data:
-        row = timeline_table.add_row()
-        row.cells[0].text = phase
-        row.cells[1].text = desc
-        row.cells[2].text = duration
-        row.cells[3].text = cumulative
-
-    doc.add_heading('8.2 Milestone Schedule', level=2)
-
-    milestones = [
-        ('M1: Foundation Complete', 'Week 4', 'Authentication, user management, basic UI'),
-        ('M2: Core Parking Ready', 'Week 10', 'Full parking management workflow'),
-        ('M3: AI Integration Complete', 'Week 15', 'Vehicle and plate detection operational'),
-        ('M4: Payment System Live', 'Week 20', 'All payment methods functional'),
-        ('M5: Real-time Features', 'Week 23', 'Live updates and notifications'),
-        ('M6: Analytics Dashboard', 'Week 26', 'Full reporting capabilities'),
-        ('M7: Beta Release', 'Week 29', 'Feature-complete for testing'),
-        ('M8: Production Launch', 'Week 31', 'Go-live with support'),
-    ]
+    body.add_data_table(TIMELINE_HEADERS, '1a365d', TIMELINE_PHASES)
 
-    milestone_table = doc.add_table(rows=1, cols=3)
-    milestone_table.style = 'Table Grid'
+    body.add_heading('8.2 Milestone Schedule', level=2)
 
-    header_cells = milestone_table.rows[0].cells
-    milestone_headers = ['Milestone', 'Target', 'Deliverables']
-    for i, header in enumerate(milestone_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '2e7d32')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
+    body.add_data_table(MILESTONE_HEADERS, '2e7d32', MILESTONES)
 
-    for name, target, deliverables in milestones:
-        row = milestone_table.add_row()
-        row.cells[0].text = name
-        row.cells[1].text = target
-        row.cells[2].text = deliverables
+    body.add_page_break()
 
-    doc.add_page_break()
 
-    # ========== 9. API DOCUMENTATION ==========
-    doc.add_heading('9. API Documentation', level=1)
+def _build_api_documentation(body):
+    """9. API Documentation"""
+    body.add_heading('9. API Documentation', level=1)
 
-    doc.add_heading('9.1 API Overview', level=2)
+    body.add_heading('9.1 API Overview', level=2)
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('SPARKING provides a comprehensive RESTful API with 60+ endpoints organized by domain. All endpoints follow consistent patterns and return JSON responses.')
-    p.paragraph_format.space_after = Pt(12)
+    p.paragraph_format.space_after = PARAGRAPH_GAP
 
     api_overview = [
         ('Base URL', 'https://api.sparking.com/api or /api (relative)'),
@@ -1161,476 +1431,134 @@ Key Differentiators:
         ('Error Format', '{ "error": "message", "code": "ERROR_CODE" }'),
     ]
 
-    for key, value in api_overview:
-        p = doc.add_paragraph()
-        p.add_run(f'{key}: ').bold = True
-        p.add_run(value)
-
-    # Authentication APIs
-    doc.add_heading('9.2 Authentication APIs', level=2)
-
-    auth_table = doc.add_table(rows=1, cols=4)
-    auth_table.style = 'Table Grid'
-
-    header_cells = auth_table.rows[0].cells
-    api_headers = ['Method', 'Endpoint', 'Description', 'Auth Required']
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '1565c0')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    auth_apis = [
-        ('POST', '/api/auth/login', 'User login with email/password', 'No'),
-        ('POST', '/api/auth/logout', 'Terminate current session', 'Yes'),
-        ('GET', '/api/auth/me', 'Get current user details', 'Yes'),
-    ]
-
-    for method, endpoint, desc, auth in auth_apis:
-        row = auth_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
-
-    # Parking Lot APIs
-    doc.add_heading('9.3 Parking Lot APIs', level=2)
-
-    lot_table = doc.add_table(rows=1, cols=4)
-    lot_table.style = 'Table Grid'
-
-    header_cells = lot_table.rows[0].cells
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '2e7d32')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    lot_apis = [
-        ('GET', '/api/parking-lots', 'List all parking lots with stats', 'Yes'),
-        ('POST', '/api/parking-lots', 'Create new parking lot', 'Admin'),
-        ('GET', '/api/parking-lots/{id}', 'Get parking lot details', 'Yes'),
-        ('PATCH', '/api/parking-lots/{id}', 'Update parking lot', 'Admin'),
-        ('GET', '/api/parking-lots/{id}/stats', 'Real-time statistics', 'Yes'),
-    ]
-
-    for method, endpoint, desc, auth in lot_apis:
-        row = lot_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
-
-    # Token APIs
-    doc.add_heading('9.4 Token Management APIs', level=2)
-
-    token_table = doc.add_table(rows=1, cols=4)
-    token_table.style = 'Table Grid'
-
-    header_cells = token_table.rows[0].cells
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], 'f57c00')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    token_apis = [
-        ('GET', '/api/tokens', 'List tokens with filters', 'Yes'),
-        ('POST', '/api/tokens', 'Create entry token', 'Yes'),
-        ('GET', '/api/tokens/{id}', 'Get token details', 'Yes'),
-        ('PATCH', '/api/tokens/{id}', 'Update token (mark exit)', 'Yes'),
-        ('DELETE', '/api/tokens/{id}', 'Cancel token', 'Admin'),
-    ]
-
-    for method, endpoint, desc, auth in token_apis:
-        row = token_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
-
-    # Payment APIs
-    doc.add_heading('9.5 Payment & Wallet APIs', level=2)
-
-    payment_table = doc.add_table(rows=1, cols=4)
-    payment_table.style = 'Table Grid'
-
-    header_cells = payment_table.rows[0].cells
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '7b1fa2')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    payment_apis = [
-        ('GET', '/api/wallet', 'Get user wallets', 'Yes'),
-        ('POST', '/api/wallet', 'Create new wallet', 'Yes'),
-        ('GET', '/api/wallet/{id}/balance', 'Get wallet balance', 'Yes'),
-        ('POST', '/api/payments/parking', 'Pay for parking', 'Yes'),
-        ('POST', '/api/payments/deposit', 'Deposit to wallet', 'Yes'),
-        ('POST', '/api/payments/withdraw', 'Withdraw to bank', 'Yes'),
-        ('POST', '/api/payments/transfer', 'P2P transfer', 'Yes'),
-        ('GET', '/api/transactions', 'Transaction history', 'Yes'),
-    ]
+    body.add_label_paragraphs(api_overview)
 
-    for method, endpoint, desc, auth in payment_apis:
-        row = payment_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
-
-    # Analytics APIs
-    doc.add_heading('9.6 Analytics APIs', level=2)
-
-    analytics_table = doc.add_table(rows=1, cols=4)
-    analytics_table.style = 'Table Grid'
-
-    header_cells = analytics_table.rows[0].cells
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '00796b')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    analytics_apis = [
-        ('GET', '/api/analytics', 'Overview metrics', 'Yes'),
-        ('GET', '/api/analytics?type=occupancy', 'Occupancy trends', 'Yes'),
-        ('GET', '/api/analytics?type=revenue', 'Revenue analysis', 'Yes'),
-        ('GET', '/api/analytics?type=traffic', 'Entry/exit patterns', 'Yes'),
-        ('GET', '/api/analytics/predictive', 'Forecasting', 'Yes'),
-        ('GET', '/api/reports/export', 'Export CSV/PDF', 'Yes'),
-    ]
-
-    for method, endpoint, desc, auth in analytics_apis:
-        row = analytics_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
-
-    # Real-time APIs
-    doc.add_heading('9.7 Real-time & Detection APIs', level=2)
-
-    realtime_table = doc.add_table(rows=1, cols=4)
-    realtime_table.style = 'Table Grid'
-
-    header_cells = realtime_table.rows[0].cells
-    for i, header in enumerate(api_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], 'c62828')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    realtime_apis = [
-        ('POST', '/api/realtime/detection', 'AI detection event (from pipeline)', 'API Key'),
-        ('GET', '/api/cameras', 'List cameras', 'Yes'),
-        ('GET', '/api/cameras/{id}/stream', 'RTSP stream proxy', 'Yes'),
-        ('GET', '/api/metrics', 'System metrics', 'Yes'),
-        ('WS', '/socket.io', 'Real-time updates', 'Yes'),
-    ]
+    # One heading + table per API group: (heading, header color, rows)
+    for heading, color, rows_data in (
+        ('9.2 Authentication APIs', '1565c0', AUTH_APIS),
+        ('9.3 Parking Lot APIs', '2e7d32', LOT_APIS),
+        ('9.4 Token Management APIs', 'f57c00', TOKEN_APIS),
+        ('9.5 Payment & Wallet APIs', '7b1fa2', PAYMENT_APIS),
+        ('9.6 Analytics APIs', '00796b', ANALYTICS_APIS),
+        ('9.7 Real-time & Detection APIs', 'c62828', REALTIME_APIS),
+    ):
+        body.add_heading(heading, level=2)
+        body.add_data_table(API_HEADERS, color, rows_data)
 
-    for method, endpoint, desc, auth in realtime_apis:
-        row = realtime_table.add_row()
-        row.cells[0].text = method
-        row.cells[1].text = endpoint
-        row.cells[2].text = desc
-        row.cells[3].text = auth
+    body.add_page_break()
 
-    doc.add_page_break()
 
-    # ========== 10. DATABASE SCHEMA ==========
-    doc.add_heading('10. Database Schema', level=1)
+def _build_database_schema(body):
+    """10. Database Schema"""
+    body.add_heading('10. Database Schema', level=1)
 
-    doc.add_heading('10.1 Schema Overview', level=2)
+    body.add_heading('10.1 Schema Overview', level=2)
 
-    p = doc.add_paragraph()
+    p = body.add_paragraph()
     p.add_run('The SPARKING database consists of 27 interconnected models managed by Prisma ORM. The schema is designed for scalability, data integrity, and efficient querying.')
-    p.paragraph_format.space_after = Pt(12)
-
-    schema_stats = [
-        ('Total Models', '27'),
-        ('Total Fields', '250+'),
-        ('Primary Database', 'PostgreSQL 16'),
-        ('ORM', 'Prisma 7.2.0'),
-        ('ID Strategy', 'CUID (collision-resistant unique identifiers)'),
-    ]
+    p.paragraph_format.space_after = PARAGRAPH_GAP
 
-    for key, value in schema_stats:
-        p = doc.add_paragraph()
-        p.add_run(f'{key}: ').bold = True
-        p.add_run(value)
+    body.add_label_paragraphs(SCHEMA_STATS)
 
     # Core Models
-    doc.add_heading('10.2 Core Models', level=2)
-
-    # Organization
-    doc.add_heading('Organization', level=3)
-    org_table = doc.add_table(rows=1, cols=3)
-    org_table.style = 'Table Grid'
-
-    header_cells = org_table.rows[0].cells
-    schema_headers = ['Field', 'Type', 'Description']
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    org_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('name', 'String', 'Organization name'),
-        ('slug', 'String @unique', 'URL-friendly identifier'),
-        ('email', 'String?', 'Contact email'),
-        ('phone', 'String?', 'Contact phone'),
-        ('address', 'String?', 'Physical address'),
-        ('logo', 'String?', 'Logo URL'),
-        ('isActive', 'Boolean @default(true)', 'Active status'),
-        ('createdAt', 'DateTime @default(now())', 'Creation timestamp'),
-        ('updatedAt', 'DateTime @updatedAt', 'Last update'),
-    ]
+    body.add_heading('10.2 Core Models', level=2)
 
-    for field, type_, desc in org_fields:
-        row = org_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    # User
-    doc.add_heading('User', level=3)
-    user_table = doc.add_table(rows=1, cols=3)
-    user_table.style = 'Table Grid'
-
-    header_cells = user_table.rows[0].cells
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    user_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('email', 'String @unique', 'Login email'),
-        ('password', 'String', 'Hashed password (bcrypt)'),
-        ('name', 'String', 'Display name'),
-        ('role', 'UserRole @default(VIEWER)', 'SUPER_ADMIN, ADMIN, OPERATOR, AUDITOR, VIEWER'),
-        ('status', 'UserStatus @default(ACTIVE)', 'ACTIVE, INACTIVE, SUSPENDED'),
-        ('organizationId', 'String?', 'Foreign key to Organization'),
-        ('maxSessions', 'Int @default(5)', 'Concurrent session limit'),
-        ('createdAt', 'DateTime @default(now())', 'Creation timestamp'),
-    ]
-
-    for field, type_, desc in user_fields:
-        row = user_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    # ParkingLot
-    doc.add_heading('ParkingLot', level=3)
-    lot_schema_table = doc.add_table(rows=1, cols=3)
-    lot_schema_table.style = 'Table Grid'
-
-    header_cells = lot_schema_table.rows[0].cells
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    lot_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('name', 'String', 'Parking lot name'),
-        ('type', 'VenueType', 'AIRPORT, MALL, HOSPITAL, STADIUM, etc.'),
-        ('address', 'String', 'Physical address'),
-        ('city', 'String', 'City'),
-        ('latitude', 'Float?', 'GPS latitude'),
-        ('longitude', 'Float?', 'GPS longitude'),
-        ('totalCapacity', 'Int', 'Total slot count'),
-        ('operatingHours', 'Json?', 'Operating schedule'),
-        ('contactPhone', 'String?', 'Contact number'),
-        ('isActive', 'Boolean @default(true)', 'Active status'),
-        ('organizationId', 'String', 'Foreign key to Organization'),
-    ]
-
-    for field, type_, desc in lot_fields:
-        row = lot_schema_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    # Slot
-    doc.add_heading('Slot', level=3)
-    slot_table = doc.add_table(rows=1, cols=3)
-    slot_table.style = 'Table Grid'
-
-    header_cells = slot_table.rows[0].cells
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    slot_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('slotNumber', 'String', 'Display number (e.g., A-001)'),
-        ('type', 'SlotType', 'STANDARD, COMPACT, LARGE, EV_CHARGING, etc.'),
-        ('status', 'SlotStatus @default(AVAILABLE)', 'AVAILABLE, OCCUPIED, RESERVED, MAINTENANCE'),
-        ('isOccupied', 'Boolean @default(false)', 'Quick occupancy check'),
-        ('vehicleType', 'VehicleType?', 'CAR, SUV, MOTORCYCLE, etc.'),
-        ('positionX', 'Float?', 'Visual map X coordinate'),
-        ('positionY', 'Float?', 'Visual map Y coordinate'),
-        ('rotation', 'Float? @default(0)', 'Visual rotation angle'),
-        ('hasEvCharger', 'Boolean @default(false)', 'EV charging availability'),
-        ('hasRoof', 'Boolean @default(false)', 'Covered parking'),
-        ('isAccessible', 'Boolean @default(false)', 'Handicap accessible'),
-        ('zoneId', 'String', 'Foreign key to Zone'),
-        ('parkingLotId', 'String', 'Foreign key to ParkingLot'),
-    ]
+    # One level-3 heading + field table per model
+    for heading, rows_data in (
+        ('Organization', ORGANIZATION_FIELDS),
+        ('User', USER_FIELDS),
+        ('ParkingLot', PARKING_LOT_FIELDS),
+        ('Slot', SLOT_FIELDS),
+        ('Token', TOKEN_FIELDS),
+        ('Wallet', WALLET_FIELDS),
+    ):
+        body.add_heading(heading, level=3)
+        body.add_data_table(FIELD_HEADERS, '37474f', rows_data)
 
-    for field, type_, desc in slot_fields:
-        row = slot_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    # Token
-    doc.add_heading('Token', level=3)
-    token_schema_table = doc.add_table(rows=1, cols=3)
-    token_schema_table.style = 'Table Grid'
-
-    header_cells = token_schema_table.rows[0].cells
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    token_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('tokenNumber', 'String @unique', 'Unique token identifier'),
-        ('type', 'TokenType', 'QR_CODE, RFID, BARCODE, ANPR, MANUAL'),
-        ('status', 'TokenStatus @default(ACTIVE)', 'ACTIVE, COMPLETED, CANCELLED, EXPIRED'),
-        ('qrCode', 'String?', 'Generated QR code data'),
-        ('licensePlate', 'String?', 'Vehicle license plate'),
-        ('entryTime', 'DateTime @default(now())', 'Entry timestamp'),
-        ('exitTime', 'DateTime?', 'Exit timestamp'),
-        ('duration', 'Int?', 'Parking duration in minutes'),
-        ('amount', 'BigInt?', 'Charged amount in paise'),
-        ('isPaid', 'Boolean @default(false)', 'Payment status'),
-        ('slotId', 'String?', 'Foreign key to Slot'),
-        ('vehicleId', 'String?', 'Foreign key to Vehicle'),
-        ('parkingLotId', 'String', 'Foreign key to ParkingLot'),
-    ]
+    body.add_heading('10.3 Model Relationships', level=2)
 
-    for field, type_, desc in token_fields:
-        row = token_schema_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    # Wallet
-    doc.add_heading('Wallet', level=3)
-    wallet_table = doc.add_table(rows=1, cols=3)
-    wallet_table.style = 'Table Grid'
-
-    header_cells = wallet_table.rows[0].cells
-    for i, header in enumerate(schema_headers):
-        header_cells[i].text = header
-        header_cells[i].paragraphs[0].runs[0].bold = True
-        set_cell_shading(header_cells[i], '37474f')
-        header_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    wallet_fields = [
-        ('id', 'String @id @default(cuid())', 'Primary key'),
-        ('type', 'WalletType', 'PERSONAL, BUSINESS, MERCHANT'),
-        ('balance', 'BigInt @default(0)', 'Balance in paise (smallest unit)'),
-        ('currency', 'String @default("INR")', 'Currency code'),
-        ('isActive', 'Boolean @default(true)', 'Active status'),
-        ('kycLevel', 'KycLevel @default(NONE)', 'NONE, BASIC, INTERMEDIATE, FULL'),
-        ('dailyLimit', 'BigInt?', 'Daily transaction limit'),
-        ('monthlyLimit', 'BigInt?', 'Monthly transaction limit'),
-        ('perTransactionLimit', 'BigInt?', 'Single transaction limit'),
-        ('userId', 'String?', 'Foreign key to User'),
-        ('parkingLotId', 'String?', 'Foreign key (for merchant wallets)'),
-    ]
+    body.add_bullets(MODEL_RELATIONSHIPS)
 
-    for field, type_, desc in wallet_fields:
-        row = wallet_table.add_row()
-        row.cells[0].text = field
-        row.cells[1].text = type_
-        row.cells[2].text = desc
-
-    doc.add_heading('10.3 Model Relationships', level=2)
-
-    relationships = [
-        'Organization → Users, ParkingLots, Settings (one-to-many)',
-        'ParkingLot → Zones, Slots, Tokens, Cameras, Gates, Displays (one-to-many)',
-        'Zone → Slots, PricingRules (one-to-many)',
-        'Slot → SlotOccupancy, Tokens (one-to-many)',
-        'User → Sessions, Wallets, AuditLogs, ParkingLotAssignments (one-to-many)',
-        'Token → Transaction, Vehicle, Slot (many-to-one)',
-        'Wallet → WalletTransactions, BankAccounts, Payments (one-to-many)',
-        'Camera → DetectionEvents (one-to-many)',
-    ]
+    body.add_heading('10.4 Indexes & Optimizations', level=2)
 
-    for rel in relationships:
-        doc.add_paragraph(rel, style='List Bullet')
+    body.add_label_paragraphs(MODEL_INDEXES)
 
-    doc.add_heading('10.4 Indexes & Optimizations', level=2)
-
-    indexes = [
-        ('Slot', 'parkingLotId, zoneId, status, isOccupied'),
-        ('Token', 'parkingLotId, status, entryTime, licensePlate'),
-        ('WalletTransaction', 'walletId, type, status, createdAt'),
-        ('DetectionEvent', 'cameraId, type, timestamp'),
-        ('AuditLog', 'userId, entityType, createdAt'),
-    ]
 
-    for model, idx in indexes:
-        p = doc.add_paragraph()
-        p.add_run(f'{model}: ').bold = True
-        p.add_run(idx)
+def _build_document_information(body):
+    """Document information footer"""
+    body.add_page_break()
 
-    # ========== FOOTER ==========
-    doc.add_page_break()
+    body.add_heading('Document Information', level=1)
 
-    doc.add_heading('Document Information', level=1)
+    body.add_label_paragraphs(DOCUMENT_INFO)
 
-    footer_info = [
-        ('Document Version', '1.0'),
-        ('Created Date', 'January 2026'),
-        ('Last Updated', 'January 2026'),
-        ('Prepared By', 'Development Team'),
-        ('Confidentiality', 'This document contains proprietary information.'),
-    ]
-
-    for key, value in footer_info:
-        p = doc.add_paragraph()
-        p.add_run(f'{key}: ').bold = True
-        p.add_run(value)
-
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(24)
+    p = body.add_paragraph()
+    p.paragraph_format.space_before = CLOSING_GAP
     p.add_run('For any questions or clarifications regarding this Statement of Work, please contact the project team.')
 
-    # Save document
-    doc_path = os.path.join(OUTPUT_DIR, 'SPARKING_Statement_of_Work.docx')
-    doc.save(doc_path)
+
+def create_sow_document(data_flow_path, architecture_path):
+    """Create the Statement of Work document"""
+    doc = new_document()
+
+    # Set document margins, all four on the existing <w:pgMar> in one pass
+    margin = str(PAGE_MARGIN.twips)
+    for section in doc.sections:
+        pg_mar = section._sectPr.get_or_add_pgMar()
+        for side in ('w:top', 'w:bottom', 'w:left', 'w:right'):
+            pg_mar.set(qn(side), margin)
+
+    body = AnchoredBody(doc)
+
+    _build_cover(body)
+    _build_toc(body)
+    _build_executive_summary(body)
+    _build_feature_list(body)
+    _build_technology_stack(body)
+    _build_data_flow(body, data_flow_path)
+    _build_architecture(body, architecture_path)
+    _build_plan_of_action(body)
+    _build_team_setup(body)
+    _build_timeline(body)
+    _build_api_documentation(body)
+    _build_database_schema(body)
+    _build_document_information(body)
+
+    body.finish()
+
+    # Save document: zip into memory, then hand the package to the OS in one write
+    doc_path = SOW_PATH
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with open(doc_path, 'wb') as f:
+        f.write(buffer.getbuffer())
     print(f"Created: {doc_path}")
     return doc_path
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate the SPARKING Statement of Work')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate even if the document is newer than this script')
+    args = parser.parse_args()
+
+    # Everything in the document comes from this file, so a newer .docx is current
+    if (not args.force and os.path.exists(SOW_PATH)
+            and os.path.getmtime(SOW_PATH) > os.path.getmtime(__file__)):
+        print(f"Up to date: {SOW_PATH} (use --force to regenerate)")
+        return
+
     print("Generating SPARKING Statement of Work...")
     print("=" * 50)
 
-    # Create diagrams
+    # Create diagrams; the two renders are independent, so run them side by side
     print("\n[1/3] Creating Data Flow Diagram...")
-    data_flow_path = create_data_flow_diagram()
-
-    print("\n[2/3] Creating Software Architecture Diagram...")
-    architecture_path = create_architecture_diagram()
+    print("[2/3] Creating Software Architecture Diagram...")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        data_flow_future = executor.submit(create_data_flow_diagram)
+        architecture_future = executor.submit(create_architecture_diagram)
+        data_flow_path = data_flow_future.result()
+        architecture_path = architecture_future.result()
 
     print("\n[3/3] Creating Statement of Work Document...")
     doc_path = create_sow_document(data_flow_path, architecture_path)
@@ -4,11 +4,20 @@ MilvusDB Utilities for Vehicle Feature Matching
 Handles vector database operations for vehicle image search.
 """
 
+import asyncio
+import collections
+import functools
+import itertools
+import json
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from typing import Optional, Sequence, Union
 
+import numpy as np
 from pymilvus import (
+    AsyncMilvusClient,
     Collection,
     CollectionSchema,
     DataType,
@@ -17,6 +26,7 @@ from pymilvus import (
     connections,
     utility,
 )
+from pymilvus.exceptions import DataNotMatchException, ParamError
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +35,167 @@ MILVUS_ENDPOINT = os.getenv("MILVUS_ENDPOINT", "http://milvus-db:19530")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "sparking_vehicles")
 FEATURE_DIM = int(os.getenv("FEATURE_MODEL_DIM", "1000"))
 
-# Index parameters for HNSW (optimal for production)
+# Vector index type, applied when the collection is created. HNSW (default)
+# searches full-precision vectors. IVF_PQ and SCANN store quantized codes:
+# roughly 8-32x less memory and faster scans, at the cost of a little recall.
+# GPU_CAGRA needs a GPU build of Milvus and scores by inner product, which
+# equals cosine similarity for the L2-normalized vectors the extractor emits.
+INDEX_TYPE = os.getenv("MILVUS_INDEX_TYPE", "HNSW").upper()
+PQ_M = int(os.getenv("MILVUS_PQ_M", "50"))  # IVF_PQ sub-vectors; must divide FEATURE_DIM
+
+# Stored vector precision, applied when the collection is created: float32
+# (default) or float16, which halves vector memory and the bytes moved per
+# search and insert. Cosine ranking is barely affected by fp16 rounding.
+VECTOR_DTYPE = os.getenv("MILVUS_VECTOR_DTYPE", "float32").lower()
+_VECTOR_FIELD_TYPES = {
+    "float32": DataType.FLOAT_VECTOR,
+    "float16": DataType.FLOAT16_VECTOR,
+}
+if VECTOR_DTYPE not in _VECTOR_FIELD_TYPES:
+    raise ValueError(f"Unsupported MILVUS_VECTOR_DTYPE: {VECTOR_DTYPE}")
+
+# (metric, index build params, search params) per index type
+_INDEX_PRESETS = {
+    "HNSW": ("COSINE", {"M": 16, "efConstruction": 256}, {"ef": 128}),
+    "IVF_PQ": ("COSINE", {"nlist": 1024, "m": PQ_M, "nbits": 8}, {"nprobe": 16}),
+    "SCANN": ("COSINE", {"nlist": 1024, "with_raw_data": False}, {"nprobe": 16}),
+    "GPU_CAGRA": (
+        "IP",
+        {"intermediate_graph_degree": 64, "graph_degree": 32},
+        {"itopk_size": 128},
+    ),
+}
+if INDEX_TYPE not in _INDEX_PRESETS:
+    raise ValueError(f"Unsupported MILVUS_INDEX_TYPE: {INDEX_TYPE}")
+METRIC_TYPE = _INDEX_PRESETS[INDEX_TYPE][0]
+
+# Index parameters
 INDEX_PARAMS = {
-    "metric_type": "COSINE",
-    "index_type": "HNSW",
-    "params": {"M": 16, "efConstruction": 256},
+    "metric_type": METRIC_TYPE,
+    "index_type": INDEX_TYPE,
+    "params": _INDEX_PRESETS[INDEX_TYPE][1],
 }
 
 # Search parameters
-SEARCH_PARAMS = {"metric_type": "COSINE", "params": {"ef": 128}}
+SEARCH_PARAMS = {"metric_type": METRIC_TYPE, "params": _INDEX_PRESETS[INDEX_TYPE][2]}
+
+# Insert batching: queued rows are written once this many are pending or
+# this many seconds have passed since the last write. Rows from a failed
+# write are re-queued, up to INSERT_MAX_PENDING rows in total.
+INSERT_BATCH_SIZE = int(os.getenv("MILVUS_INSERT_BATCH_SIZE", "64"))
+INSERT_FLUSH_INTERVAL = float(os.getenv("MILVUS_INSERT_FLUSH_INTERVAL", "1.0"))
+INSERT_MAX_PENDING = int(os.getenv("MILVUS_INSERT_MAX_PENDING", "10000"))
+
+# pymilvus validates every row of an insert on the client and rejects the
+# whole request over one bad row (an over-long string, a wrong type). Retrying
+# such a batch can never succeed, so flushes then write row by row and drop
+# the offending rows; any other failure (Milvus unreachable) re-queues them.
+_INVALID_ROW_ERRORS = (ParamError, DataNotMatchException, TypeError, ValueError)
+
+# Recently inserted feature ids; camera pipelines re-emit sticky detections
+SEEN_CACHE_SIZE = int(os.getenv("MILVUS_SEEN_CACHE_SIZE", "100000"))
+
+# Every stored scalar field, for callers that need full match details;
+# searches return only ids and scores unless asked for more
+MATCH_FIELDS = (
+    "camera_id",
+    "vehicle_type",
+    "vehicle_color",
+    "license_plate",
+    "detected_at",
+    "confidence",
+    "image_url",
+)
+
+# Camera-filtered searches only touch the partitions their camera_ids hash to
+NUM_PARTITIONS = int(os.getenv("MILVUS_NUM_PARTITIONS", "16"))
+
+# Each MilvusClient owns its own gRPC channel; requests round-robin over the pool
+POOL_SIZE = max(1, int(os.getenv("MILVUS_POOL_SIZE", "4")))
+
+
+@functools.lru_cache(maxsize=1024)
+def _filter_expr(camera_ids: tuple[str, ...], min_confidence: float) -> Optional[str]:
+    """Build the search filter expression; None when nothing is filtered."""
+    clauses = []
+    if camera_ids:
+        # json.dumps quotes and escapes each ID as a Milvus string literal
+        clauses.append(f"camera_id in {json.dumps(camera_ids, ensure_ascii=False)}")
+    if min_confidence > 0:
+        clauses.append(f"confidence >= {min_confidence}")
+    return " and ".join(clauses) or None
+
+
+def _as_vector(vector: Union[list[float], np.ndarray]) -> Union[list[float], np.ndarray]:
+    """Convert a feature vector to the form pymilvus sends fastest for VECTOR_DTYPE.
+
+    float16 fields take float16 ndarrays, which go over the wire with
+    tobytes(). float32 vectors are packed with struct.pack(*v) even when
+    given an ndarray, and unpacking numpy scalars there is far slower than
+    floats, so arrays are flattened to a float list in one C-level pass.
+    """
+    if VECTOR_DTYPE == "float16":
+        return np.asarray(vector, dtype=np.float16).ravel()
+    if isinstance(vector, np.ndarray):
+        return vector.astype(np.float32, copy=False).ravel().tolist()
+    return vector
+
+
+def feature_row(
+    feature_id: str,
+    feature_vector: Union[list[float], np.ndarray],
+    camera_id: str,
+    detected_at: int,
+    confidence: float,
+    image_url: str,
+    vehicle_type: str = "",
+    vehicle_color: str = "",
+    license_plate: str = "",
+) -> dict:
+    """Build a collection row for a vehicle feature."""
+    return {
+        "id": feature_id,
+        "feature_vector": _as_vector(feature_vector),
+        "camera_id": camera_id,
+        "vehicle_type": vehicle_type or "",
+        "vehicle_color": vehicle_color or "",
+        "license_plate": license_plate or "",
+        "detected_at": detected_at,
+        "confidence": confidence,
+        "image_url": image_url,
+    }
+
+
+def _search_request(
+    query_vector: Union[list[float], np.ndarray],
+    limit: int,
+    camera_ids: Optional[list[str]],
+    min_confidence: float,
+    strict: bool,
+    output_fields: Sequence[str],
+) -> dict:
+    """Keyword arguments for a sync or async client search call."""
+    filter_expr = _filter_expr(tuple(camera_ids or ()), min_confidence)
+    return {
+        "collection_name": COLLECTION_NAME,
+        "data": [_as_vector(query_vector)],
+        "anns_field": "feature_vector",
+        "search_params": SEARCH_PARAMS,
+        "limit": limit,
+        "filter": filter_expr or "",
+        "output_fields": list(output_fields),
+        "consistency_level": "Strong" if strict else "Eventually",
+    }
+
+
+def _matches(results: list[list[dict]]) -> list[dict]:
+    """Flatten search hits into match dicts."""
+    # Each hit's entity holds exactly the requested output fields
+    return [
+        {"id": hit["id"], "score": hit["distance"], **hit["entity"]}  # score: cosine similarity
+        for hits in results
+        for hit in hits
+    ]
 
 
 class MilvusVehicleIndex:
@@ -42,6 +204,19 @@ class MilvusVehicleIndex:
     def __init__(self):
         self.client: Optional[MilvusClient] = None
         self.collection: Optional[Collection] = None
+        self._pool: list[MilvusClient] = []
+        self._pool_cycle = None
+        self.aclient: Optional[AsyncMilvusClient] = None
+        self._pending: list[dict] = []
+        self._pending_lock = threading.Lock()
+        self._seen: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._last_flush = time.monotonic()
+        self._ready = threading.Event()
+        self._ready_lock = threading.Lock()
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="milvus-flusher", daemon=True
+        )
 
     def connect(self) -> bool:
         """Connect to MilvusDB."""
@@ -56,8 +231,14 @@ class MilvusVehicleIndex:
 
             connections.connect(alias="default", host=host, port=int(port))
 
-            # Initialize client for simpler operations
-            self.client = MilvusClient(uri=MILVUS_ENDPOINT)
+            # Initialize clients for simpler operations
+            self._pool = [MilvusClient(uri=MILVUS_ENDPOINT) for _ in range(POOL_SIZE)]
+            self._pool_cycle = itertools.cycle(self._pool)
+            self.client = self._pool[0]
+
+            # Write queued rows on time even when no further insert arrives
+            if not self._flusher.is_alive():
+                self._flusher.start()
 
             logger.info(f"Connected to MilvusDB at {MILVUS_ENDPOINT}")
             return True
@@ -65,8 +246,38 @@ class MilvusVehicleIndex:
             logger.error(f"Failed to connect to MilvusDB: {e}")
             return False
 
+    def _next_client(self) -> MilvusClient:
+        """Next pooled client for a data-path request."""
+        return next(self._pool_cycle)
+
+    def _async_client(self) -> AsyncMilvusClient:
+        """Async client, created on first use so it binds to the running event loop."""
+        if self.aclient is None:
+            self.aclient = AsyncMilvusClient(uri=MILVUS_ENDPOINT)
+        return self.aclient
+
     def ensure_collection(self) -> bool:
-        """Ensure the collection exists with proper schema."""
+        """Ensure the collection exists with proper schema.
+
+        Only the first successful call goes to Milvus; later calls are a flag
+        check, and concurrent first callers wait for the one doing the setup.
+        """
+        if self._ready.is_set():
+            return True
+
+        with self._ready_lock:
+            if not self._ready.is_set() and self._load_or_create_collection():
+                self._ready.set()
+        return self._ready.is_set()
+
+    async def aensure_collection(self) -> bool:
+        """ensure_collection() without blocking the event loop on first setup."""
+        if self._ready.is_set():
+            return True
+        return await asyncio.to_thread(self.ensure_collection)
+
+    def _load_or_create_collection(self) -> bool:
+        """Load the collection, creating it and its indexes if missing."""
         try:
             if utility.has_collection(COLLECTION_NAME):
                 self.collection = Collection(COLLECTION_NAME)
@@ -84,13 +295,14 @@ class MilvusVehicleIndex:
                 ),
                 FieldSchema(
                     name="feature_vector",
-                    dtype=DataType.FLOAT_VECTOR,
+                    dtype=_VECTOR_FIELD_TYPES[VECTOR_DTYPE],
                     dim=FEATURE_DIM,
                 ),
                 FieldSchema(
                     name="camera_id",
                     dtype=DataType.VARCHAR,
                     max_length=64,
+                    is_partition_key=True,
                 ),
                 FieldSchema(
                     name="vehicle_type",
@@ -130,6 +342,8 @@ class MilvusVehicleIndex:
             self.collection = Collection(
                 name=COLLECTION_NAME,
                 schema=schema,
+                consistency_level="Eventually",
+                num_partitions=NUM_PARTITIONS,
             )
 
             # Create index on feature vector
@@ -155,7 +369,7 @@ class MilvusVehicleIndex:
     def insert_feature(
         self,
         feature_id: str,
-        feature_vector: list[float],
+        feature_vector: Union[list[float], np.ndarray],
         camera_id: str,
         detected_at: int,
         confidence: float,
@@ -163,111 +377,355 @@ class MilvusVehicleIndex:
         vehicle_type: str = "",
         vehicle_color: str = "",
         license_plate: str = "",
+        wait: bool = False,
     ) -> bool:
-        """Insert a vehicle feature vector."""
+        """Queue a vehicle feature vector; rows are written to Milvus in batches.
+
+        Returns True once the row is queued. Queued rows are retried until
+        written, so callers that must know the row landed (e.g. a request that
+        reports success) pass wait=True to write it immediately instead.
+        """
+        with self._pending_lock:
+            if not self._remember(feature_id):
+                logger.debug(f"Skipped duplicate feature: {feature_id}")
+                return True
+
+        row = feature_row(
+            feature_id,
+            feature_vector,
+            camera_id,
+            detected_at,
+            confidence,
+            image_url,
+            vehicle_type,
+            vehicle_color,
+            license_plate,
+        )
+
+        if wait:
+            if self.insert_features([row]):
+                return True
+            self._forget([row])
+            return False
+
+        with self._pending_lock:
+            self._pending.append(row)
+            if (
+                len(self._pending) < INSERT_BATCH_SIZE
+                and time.monotonic() - self._last_flush < INSERT_FLUSH_INTERVAL
+            ):
+                logger.debug(f"Queued feature: {feature_id}")
+                return True
+
+        return self.flush()
+
+    def insert_features(self, rows: list[dict]) -> bool:
+        """Insert a batch of feature rows (same keys as insert_feature) in one call."""
         try:
-            if not self.collection:
-                if not self.ensure_collection():
-                    return False
-
-            data = [
-                {
-                    "id": feature_id,
-                    "feature_vector": feature_vector,
-                    "camera_id": camera_id,
-                    "vehicle_type": vehicle_type or "",
-                    "vehicle_color": vehicle_color or "",
-                    "license_plate": license_plate or "",
-                    "detected_at": detected_at,
-                    "confidence": confidence,
-                    "image_url": image_url,
-                }
-            ]
+            self._insert_rows(rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to insert features: {e}")
+            return False
 
-            self.collection.insert(data)
-            logger.debug(f"Inserted feature: {feature_id}")
+    def _insert_rows(self, rows: list[dict]):
+        """Insert rows in one call, raising on failure."""
+        if not self.ensure_collection():
+            raise ConnectionError(f"Collection {COLLECTION_NAME} is not available")
+        self._next_client().insert(collection_name=COLLECTION_NAME, data=rows)
+        logger.debug(f"Inserted {len(rows)} features")
+
+    async def ainsert_feature_batch(self, rows: list[dict]) -> bool:
+        """Write rows built with feature_row() in one call, skipping recently seen ids.
+
+        For callers that batch on their own; rows bypass the insert queue.
+        Invalid rows are dropped rather than failing the whole batch.
+        """
+        with self._pending_lock:
+            rows = [row for row in rows if self._remember(row["id"])]
+
+        unwritten = await self._awrite_rows(rows) if rows else []
+        if unwritten:
+            self._forget(unwritten)
+        return not unwritten
+
+    async def ainsert_features(self, rows: list[dict]) -> bool:
+        """insert_features() without blocking the event loop."""
+        try:
+            await self._ainsert_rows(rows)
             return True
+        except Exception as e:
+            logger.error(f"Failed to insert features: {e}")
+            return False
+
+    async def _ainsert_rows(self, rows: list[dict]):
+        """_insert_rows() without blocking the event loop."""
+        if not await self.aensure_collection():
+            raise ConnectionError(f"Collection {COLLECTION_NAME} is not available")
+        await self._async_client().insert(collection_name=COLLECTION_NAME, data=rows)
+        logger.debug(f"Inserted {len(rows)} features")
+
+    def bulk_load(self, vectors_npy: str, meta_parquet: str, chunk: int = 10_000) -> int:
+        """Back-fill the collection from an .npy vector file and a Parquet sidecar.
+
+        Row i of the Parquet file (columns named like insert_feature's keyword
+        arguments) describes vector i. Vectors are memory-mapped, so only one
+        chunk at a time is resident, and each chunk is a single columnar insert.
+        Returns the number of rows written; like the other methods it logs
+        failures instead of raising, and writes nothing when the two files
+        don't have the same number of rows.
+        """
+        import pyarrow.parquet as pq  # offline back-fills only
+
+        loaded = 0
+        try:
+            if not self.ensure_collection():
+                logger.error("Bulk load skipped: collection not available")
+                return 0
+
+            vectors = np.load(vectors_npy, mmap_mode="r")
+            meta = pq.ParquetFile(meta_parquet)
+            if meta.metadata.num_rows != len(vectors):
+                logger.error(
+                    f"Bulk load skipped: {meta_parquet} has {meta.metadata.num_rows} rows "
+                    f"but {vectors_npy} has {len(vectors)} vectors"
+                )
+                return 0
+
+            dtype = np.float16 if VECTOR_DTYPE == "float16" else np.float32
+            scalar_fields = [
+                field.name
+                for field in self.collection.schema.fields
+                if field.name != "feature_vector"
+            ]
+
+            for batch in meta.iter_batches(batch_size=chunk):
+                columns = {name: batch.column(name).to_pylist() for name in scalar_fields}
+                columns["feature_vector"] = np.asarray(
+                    vectors[loaded:loaded + batch.num_rows], dtype=dtype
+                )
+                self.collection.insert(
+                    [columns[field.name] for field in self.collection.schema.fields]
+                )
+                loaded += batch.num_rows
+                logger.info(f"Bulk loaded {loaded}/{len(vectors)} features")
 
         except Exception as e:
-            logger.error(f"Failed to insert feature: {e}")
+            logger.error(f"Bulk load failed after {loaded} features: {e}")
+
+        return loaded
+
+    def _remember(self, feature_id: str) -> bool:
+        """Record a feature id as inserted; False if it was seen recently.
+
+        Caller holds _pending_lock.
+        """
+        if feature_id in self._seen:
+            self._seen.move_to_end(feature_id)
             return False
+        self._seen[feature_id] = None
+        if len(self._seen) > SEEN_CACHE_SIZE:
+            self._seen.popitem(last=False)
+        return True
+
+    def _take_pending(self) -> list[dict]:
+        """Detach the queued rows for writing."""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        return rows
+
+    def _forget(self, rows: list[dict]):
+        """Let rows whose write failed through again when the caller retries."""
+        with self._pending_lock:
+            for row in rows:
+                self._seen.pop(row["id"], None)
+
+    def _requeue(self, rows: list[dict]):
+        """Put rows from a failed write back at the head of the queue.
+
+        Beyond INSERT_MAX_PENDING queued rows, the oldest are dropped.
+        """
+        with self._pending_lock:
+            self._pending[:0] = rows
+            overflow = len(self._pending) - INSERT_MAX_PENDING
+            if overflow > 0:
+                dropped, self._pending = self._pending[:overflow], self._pending[overflow:]
+                for row in dropped:
+                    self._seen.pop(row["id"], None)
+                logger.error(f"Insert queue full, dropped {overflow} features")
+        logger.warning(f"Re-queued {len(rows)} features after a failed write")
+
+    def _flush_periodically(self):
+        """Background flusher: writes queued rows every INSERT_FLUSH_INTERVAL."""
+        while not self._closing.wait(INSERT_FLUSH_INTERVAL):
+            with self._pending_lock:
+                due = (
+                    self._pending
+                    and time.monotonic() - self._last_flush >= INSERT_FLUSH_INTERVAL
+                )
+            if due:
+                self.flush()
+
+    def _drop_invalid(self, row: dict, error: Exception):
+        """Discard a queued row Milvus can never accept."""
+        logger.error(f"Dropped invalid feature {row.get('id')!r}: {error}")
+        self._forget([row])
+
+    def _write_rows(self, rows: list[dict]) -> list[dict]:
+        """Write rows in one call, falling back to row by row if any is invalid.
+
+        Invalid rows are dropped. Returns the rows left unwritten by any other
+        failure (empty when everything was written or dropped).
+        """
+        try:
+            self._insert_rows(rows)
+            return []
+        except _INVALID_ROW_ERRORS as e:
+            logger.warning(f"Batch of {len(rows)} features rejected, writing row by row: {e}")
+        except Exception as e:
+            logger.error(f"Failed to insert features: {e}")
+            return rows
+
+        for i, row in enumerate(rows):
+            try:
+                self._insert_rows([row])
+            except _INVALID_ROW_ERRORS as e:
+                self._drop_invalid(row, e)
+            except Exception as e:
+                logger.error(f"Failed to insert features: {e}")
+                return rows[i:]
+        return []
+
+    async def _awrite_rows(self, rows: list[dict]) -> list[dict]:
+        """_write_rows() without blocking the event loop."""
+        try:
+            await self._ainsert_rows(rows)
+            return []
+        except _INVALID_ROW_ERRORS as e:
+            logger.warning(f"Batch of {len(rows)} features rejected, writing row by row: {e}")
+        except Exception as e:
+            logger.error(f"Failed to insert features: {e}")
+            return rows
+
+        for i, row in enumerate(rows):
+            try:
+                await self._ainsert_rows([row])
+            except _INVALID_ROW_ERRORS as e:
+                self._drop_invalid(row, e)
+            except Exception as e:
+                logger.error(f"Failed to insert features: {e}")
+                return rows[i:]
+        return []
+
+    def flush(self) -> bool:
+        """Write any queued feature rows to Milvus; False if the write failed.
+
+        Invalid rows are dropped; after any other failure the unwritten rows
+        are re-queued for the next flush.
+        """
+        rows = self._take_pending()
+        unwritten = self._write_rows(rows) if rows else []
+        if unwritten:
+            self._requeue(unwritten)
+        return not unwritten
+
+    async def aflush(self) -> bool:
+        """flush() without blocking the event loop."""
+        rows = self._take_pending()
+        unwritten = await self._awrite_rows(rows) if rows else []
+        if unwritten:
+            self._requeue(unwritten)
+        return not unwritten
 
     def search_similar(
         self,
-        query_vector: list[float],
+        query_vector: Union[list[float], np.ndarray],
         limit: int = 10,
         camera_ids: Optional[list[str]] = None,
         min_confidence: float = 0.0,
+        strict: bool = False,
+        output_fields: Sequence[str] = ("id",),
     ) -> list[dict]:
-        """Search for similar vehicle features."""
+        """Search for similar vehicle features.
+
+        Searches use eventual consistency, since matching tolerates
+        sub-second staleness; pass strict=True to read every accepted write.
+        Rows still in the insert queue are not visible until the next flush.
+        Matches carry id and score only; pass output_fields (e.g. MATCH_FIELDS)
+        to fetch stored fields as well.
+        """
         try:
-            if not self.collection:
-                if not self.ensure_collection():
-                    return []
-
-            # Build filter expression
-            filter_expr = ""
-            if camera_ids:
-                # Sanitize camera IDs to prevent injection (escape quotes)
-                sanitized_ids = [cid.replace('"', '\\"').replace("'", "\\'") for cid in camera_ids]
-                camera_filter = " || ".join(
-                    [f'camera_id == "{cid}"' for cid in sanitized_ids]
-                )
-                filter_expr = f"({camera_filter})"
-            if min_confidence > 0:
-                conf_filter = f"confidence >= {min_confidence}"
-                filter_expr = (
-                    f"{filter_expr} && {conf_filter}" if filter_expr else conf_filter
-                )
+            if not self.ensure_collection():
+                return []
 
-            results = self.collection.search(
-                data=[query_vector],
-                anns_field="feature_vector",
-                param=SEARCH_PARAMS,
-                limit=limit,
-                expr=filter_expr if filter_expr else None,
-                output_fields=[
-                    "id",
-                    "camera_id",
-                    "vehicle_type",
-                    "vehicle_color",
-                    "license_plate",
-                    "detected_at",
-                    "confidence",
-                    "image_url",
-                ],
+            results = self._next_client().search(
+                **_search_request(
+                    query_vector, limit, camera_ids, min_confidence, strict, output_fields
+                )
             )
+            return _matches(results)
 
-            matches = []
-            for hits in results:
-                for hit in hits:
-                    matches.append(
-                        {
-                            "id": hit.entity.get("id"),
-                            "score": hit.score,  # Cosine similarity
-                            "camera_id": hit.entity.get("camera_id"),
-                            "vehicle_type": hit.entity.get("vehicle_type"),
-                            "vehicle_color": hit.entity.get("vehicle_color"),
-                            "license_plate": hit.entity.get("license_plate"),
-                            "detected_at": hit.entity.get("detected_at"),
-                            "confidence": hit.entity.get("confidence"),
-                            "image_url": hit.entity.get("image_url"),
-                        }
-                    )
-
-            return matches
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return []
+
+    async def asearch_similar(
+        self,
+        query_vector: Union[list[float], np.ndarray],
+        limit: int = 10,
+        camera_ids: Optional[list[str]] = None,
+        min_confidence: float = 0.0,
+        strict: bool = False,
+        output_fields: Sequence[str] = ("id",),
+    ) -> list[dict]:
+        """search_similar() without blocking the event loop."""
+        try:
+            if not await self.aensure_collection():
+                return []
+
+            results = await self._async_client().search(
+                **_search_request(
+                    query_vector, limit, camera_ids, min_confidence, strict, output_fields
+                )
+            )
+            return _matches(results)
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    def _unqueue(self, feature_id: str):
+        """Forget a feature id and drop its row if it is still queued."""
+        with self._pending_lock:
+            self._seen.pop(feature_id, None)
+            self._pending = [row for row in self._pending if row["id"] != feature_id]
+
     def delete_feature(self, feature_id: str) -> bool:
         """Delete a feature by ID."""
+        self._unqueue(feature_id)
+
         try:
-            if not self.collection:
+            if not self.ensure_collection():
                 return False
 
-            self.collection.delete(expr=f'id == "{feature_id}"')
+            self._next_client().delete(collection_name=COLLECTION_NAME, ids=[feature_id])
+            logger.debug(f"Deleted feature: {feature_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete feature: {e}")
+            return False
+
+    async def adelete_feature(self, feature_id: str) -> bool:
+        """delete_feature() without blocking the event loop."""
+        self._unqueue(feature_id)
+
+        try:
+            if not await self.aensure_collection():
+                return False
+
+            await self._async_client().delete(collection_name=COLLECTION_NAME, ids=[feature_id])
             logger.debug(f"Deleted feature: {feature_id}")
             return True
 
@@ -276,15 +734,19 @@ class MilvusVehicleIndex:
             return False
 
     def get_stats(self) -> dict:
-        """Get collection statistics."""
+        """Get collection statistics.
+
+        The row count comes from Milvus's collection stats without sealing
+        segments, so very recent inserts may not be counted yet.
+        """
         try:
             if not self.collection:
                 return {}
 
-            self.collection.flush()
+            stats = self.client.get_collection_stats(COLLECTION_NAME)
             return {
                 "collection_name": COLLECTION_NAME,
-                "num_entities": self.collection.num_entities,
+                "num_entities": stats["row_count"],
                 "feature_dim": FEATURE_DIM,
             }
 
@@ -293,25 +755,56 @@ class MilvusVehicleIndex:
             return {}
 
     def close(self):
-        """Close connection."""
+        """Write queued features, then close connection."""
+        self._closing.set()
+        if not self.flush():
+            logger.error(f"Closing with {len(self._pending)} features unwritten")
+
         try:
             if self.collection:
                 self.collection.release()
+            for client in self._pool:
+                client.close()
             connections.disconnect("default")
             logger.info("Disconnected from MilvusDB")
         except Exception as e:
             logger.warning(f"Error during disconnect: {e}")
 
+    async def aclose(self):
+        """close() for async code; also closes the async client."""
+        await self.aflush()
+        if self.aclient is not None:
+            try:
+                await self.aclient.close()
+            except Exception as e:
+                logger.warning(f"Error during disconnect: {e}")
+            self.aclient = None
+        await asyncio.to_thread(self.close)
+
 
 # Singleton instance
 _milvus_index: Optional[MilvusVehicleIndex] = None
+_milvus_lock = threading.Lock()
 
 
 def get_milvus_index() -> MilvusVehicleIndex:
     """Get or create MilvusDB index instance."""
     global _milvus_index
-    if _milvus_index is None:
-        _milvus_index = MilvusVehicleIndex()
-        _milvus_index.connect()
-        _milvus_index.ensure_collection()
+    if _milvus_index is not None:
+        return _milvus_index
+
+    # Concurrent first callers would otherwise each connect and set up the collection
+    with _milvus_lock:
+        if _milvus_index is None:
+            index = MilvusVehicleIndex()
+            index.connect()
+            index.ensure_collection()
+            _milvus_index = index
     return _milvus_index
+
+
+async def get_milvus_index_async() -> MilvusVehicleIndex:
+    """get_milvus_index() for async code: the first, blocking setup runs off the event loop."""
+    if _milvus_index is not None:
+        return _milvus_index
+    return await asyncio.to_thread(get_milvus_index)
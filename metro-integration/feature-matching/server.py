@@ -9,12 +9,17 @@ FastAPI service that:
 """
 
 import asyncio
+import collections
+import hashlib
 import io
-import json
+import itertools
 import logging
 import os
+import secrets
+import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
@@ -23,16 +28,17 @@ from typing import Optional
 import aiofiles
 import httpx
 import numpy as np
+import orjson
 import paho.mqtt.client as mqtt
 import torch
-import torchvision.transforms as transforms
 from fastapi import FastAPI, File, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from PIL import Image
 from pydantic import BaseModel
+from torchvision.transforms import v2
 
-from milvus_utils import get_milvus_index
+from milvus_utils import FEATURE_DIM, MATCH_FIELDS, feature_row, get_milvus_index_async
 
 # Configure logging
 log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
@@ -51,12 +57,132 @@ DETECTION_API_KEY = os.getenv("DETECTION_API_KEY", "")
 STATIC_DIR = Path("/usr/src/app/static")
 STATIC_DIR.mkdir(exist_ok=True)
 
+# Feature extraction batching: concurrent requests share one forward pass
+FEATURE_BATCH_MAX = int(
+    os.getenv("FEATURE_BATCH_MAX", "32" if torch.cuda.is_available() else "8")
+)
+FEATURE_BATCH_WAIT = float(os.getenv("FEATURE_BATCH_WAIT_MS", "5")) / 1000
+
+# Model calls run on one dedicated thread, so decode and Milvus work in the
+# default executor never queue behind a forward pass. Parallelism comes from
+# torch's intra-op threads; set TORCH_NUM_THREADS to the physical cores
+# available to each uvicorn worker.
+inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+torch.set_num_interop_threads(1)
+if os.getenv("TORCH_NUM_THREADS"):
+    torch.set_num_threads(int(os.getenv("TORCH_NUM_THREADS")))
+
+# INT8 quantization of the CPU extractor. Quantized embeddings differ slightly
+# from FP32 ones, so enable it before indexing rather than on a live index.
+FEATURE_INT8 = os.getenv("FEATURE_INT8", "false").lower() == "true"
+CALIBRATION_IMAGES = int(os.getenv("FEATURE_CALIBRATION_IMAGES", "64"))
+
+# Optional PCA down-projection of extracted features (.npz with "mean" and
+# "components"); FEATURE_MODEL_DIM must then match the projected size.
+# Create one with: python server.py fit-projection 128
+FEATURE_PROJECTION_PATH = os.getenv("FEATURE_PROJECTION_PATH", "")
+
+# Recently indexed uploads (BLAKE2b digest of image + metadata -> feature ID);
+# re-uploads of the same image with the same metadata skip extraction and
+# indexing. The cache is per process: with several workers a re-upload may
+# still be indexed again by another worker, and a hit is only reused while
+# its image file exists, so a DELETE handled by any worker invalidates it.
+INDEXED_IMAGE_CACHE_SIZE = int(os.getenv("INDEXED_IMAGE_CACHE_SIZE", "10000"))
+indexed_images: collections.OrderedDict[bytes, str] = collections.OrderedDict()
+
+# Image writes still in flight (path -> task); holds references until each
+# task finishes and lets a delete wait for the write to the same file
+pending_writes: dict[Path, asyncio.Task] = {}
+
+# In-process exact search over the most recently stored features. Off by
+# default: when enabled, unfiltered /search requests are answered from the
+# last SEARCH_CACHE_SIZE features without a Milvus round trip, and fall back
+# to Milvus when the cache has fewer than `limit` hits or none scoring at
+# least SEARCH_CACHE_MIN_SCORE. Two limits: an answer from the cache can miss
+# older features in Milvus that score higher, and the cache is per process, so
+# a DELETE only evicts from the worker that served it. Enable it only with a
+# single worker, or where briefly serving deleted features is acceptable.
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "0"))
+SEARCH_CACHE_MIN_SCORE = float(os.getenv("SEARCH_CACHE_MIN_SCORE", "0.8"))
+
+
+class RecentFeatureCache:
+    """Ring buffer of recent feature rows searched by inner product.
+
+    Stored vectors are L2-normalized, so the inner product is the same
+    cosine similarity Milvus reports as the match score.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.vectors: Optional[np.ndarray] = None  # allocated on first add
+        self.rows: list[Optional[dict]] = [None] * capacity
+        self.slots: dict[str, int] = {}
+        self.next_slot = 0
+
+    def add(self, rows: list[dict]):
+        """Store feature rows (as built by feature_row), replacing the oldest."""
+        for row in rows:
+            if row["id"] in self.slots:
+                continue
+            vector = np.asarray(row["feature_vector"], dtype=np.float32).ravel()
+            vector = vector / max(float(np.linalg.norm(vector)), 1e-12)
+            if self.vectors is None:
+                self.vectors = np.zeros((self.capacity, vector.size), dtype=np.float32)
+
+            slot = self.next_slot
+            evicted = self.rows[slot]
+            if evicted is not None:
+                del self.slots[evicted["id"]]
+            self.vectors[slot] = vector
+            self.rows[slot] = {k: v for k, v in row.items() if k != "feature_vector"}
+            self.slots[row["id"]] = slot
+            self.next_slot = (slot + 1) % self.capacity
+
+    def remove(self, feature_id: str):
+        """Drop a feature, e.g. after it was deleted from Milvus."""
+        slot = self.slots.pop(feature_id, None)
+        if slot is not None:
+            self.rows[slot] = None
+            self.vectors[slot] = 0
+
+    def search(self, query_vector: list[float], limit: int) -> list[dict]:
+        """Top matches by cosine similarity, best first."""
+        if not self.slots:
+            return []
+
+        scores = self.vectors @ np.asarray(query_vector, dtype=np.float32)
+        occupied = np.fromiter(self.slots.values(), dtype=np.intp)
+        k = min(limit, occupied.size)
+        top = occupied[np.argpartition(-scores[occupied], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+        return [{**self.rows[i], "score": float(scores[i])} for i in top]
+
+
+recent_features = RecentFeatureCache(SEARCH_CACHE_SIZE) if SEARCH_CACHE_SIZE > 0 else None
+
+# Feature IDs: 8-byte ns timestamp + 4-byte per-process node + 4-byte counter
+_id_node = secrets.token_bytes(4)
+_id_counter = itertools.count()
+
+
+def make_id() -> str:
+    """Unique, time-ordered 32-char hex feature ID without a urandom call per ID."""
+    return (
+        time.time_ns().to_bytes(8, "big")
+        + _id_node
+        + (next(_id_counter) & 0xFFFFFFFF).to_bytes(4, "big")
+    ).hex()
+
+
 # Feature extraction model
 feature_extractor = None
 transform = None
+feature_queue: Optional[asyncio.Queue] = None
+feature_projection: Optional[tuple[torch.Tensor, torch.Tensor]] = None
 
 
-def load_feature_extractor():
+def load_feature_extractor(load_projection: bool = True):
     """Load pre-trained ResNet model for feature extraction."""
     global feature_extractor, transform
 
@@ -73,58 +199,294 @@ def load_feature_extractor():
         )
         feature_extractor.eval()
 
+        # NHWC lets oneDNN/cuDNN pick their fastest convolution kernels
+        feature_extractor = feature_extractor.to(memory_format=torch.channels_last)
+
         # Move to GPU if available
         if torch.cuda.is_available():
-            feature_extractor = feature_extractor.cuda()
-            logger.info("Feature extractor loaded on GPU")
+            # FP16 runs on Tensor Cores; L2-normalized embeddings are unaffected
+            feature_extractor = feature_extractor.cuda().half()
+            # Inputs are always 224x224, so autotuned conv kernels stay valid
+            torch.backends.cudnn.benchmark = True
+            logger.info("Feature extractor loaded on GPU (FP16)")
         else:
             logger.info("Feature extractor loaded on CPU")
 
         # Image preprocessing
-        transform = transforms.Compose(
+        transform = v2.Compose(
             [
-                transforms.Resize((224, 224)),
-                transforms.ToTensor(),
-                transforms.Normalize(
+                v2.PILToTensor(),
+                v2.Resize((224, 224), antialias=True),
+                v2.ToDtype(torch.float32, scale=True),
+                v2.Normalize(
                     mean=[0.485, 0.456, 0.406],
                     std=[0.229, 0.224, 0.225],
                 ),
             ]
         )
 
+        if load_projection:
+            load_feature_projection()
+
+        if not torch.cuda.is_available():
+            if FEATURE_INT8:
+                feature_extractor = quantize_feature_extractor(feature_extractor)
+            else:
+                feature_extractor = optimize_feature_extractor(feature_extractor)
+
         return True
     except Exception as e:
         logger.error(f"Failed to load feature extractor: {e}")
         return False
 
 
-def extract_features(image: Image.Image) -> Optional[list[float]]:
-    """Extract feature vector from image."""
-    global feature_extractor, transform
-
-    if feature_extractor is None or transform is None:
-        logger.error("Feature extractor not loaded")
-        return None
+def optimize_feature_extractor(model: torch.nn.Module) -> torch.nn.Module:
+    """Compile the FP32 CPU extractor into a frozen TorchScript graph.
 
+    Freezing folds BatchNorm into the convolutions and drops per-layer Python
+    dispatch. When Intel Extension for PyTorch is installed, ipex.optimize
+    first picks oneDNN kernels, running in BF16 on CPUs with native support.
+    Returns the eager model if tracing fails.
+    """
+    example_inputs = (torch.rand(1, 3, 224, 224),)
+    bf16 = False
     try:
-        # Convert to RGB if necessary
-        if image.mode != "RGB":
-            image = image.convert("RGB")
+        try:
+            import intel_extension_for_pytorch as ipex
 
-        # Preprocess
-        img_tensor = transform(image).unsqueeze(0)
+            bf16 = torch.ops.mkldnn._is_mkldnn_bf16_supported()
+            model = ipex.optimize(model, dtype=torch.bfloat16 if bf16 else torch.float32)
+        except ImportError:
+            pass
 
-        if torch.cuda.is_available():
-            img_tensor = img_tensor.cuda()
+        with torch.no_grad(), torch.autocast("cpu", dtype=torch.bfloat16, enabled=bf16):
+            optimized = torch.jit.freeze(torch.jit.trace(model, example_inputs))
+
+        logger.info(f"Feature extractor compiled to TorchScript ({'BF16' if bf16 else 'FP32'})")
+        return optimized
+
+    except Exception as e:
+        logger.warning(f"Feature extractor optimization failed, running eager: {e}")
+        return model
+
+
+def calibration_batches(batch_size: int = 8) -> list[torch.Tensor]:
+    """Preprocessed batches of stored vehicle images for INT8 calibration."""
+    tensors = []
+    for path in sorted(STATIC_DIR.glob("*.jpg"))[:CALIBRATION_IMAGES]:
+        try:
+            with Image.open(path) as image:
+                tensors.append(preprocess_image(image))
+        except Exception as e:
+            logger.warning(f"Skipping calibration image {path.name}: {e}")
+
+    if not tensors:
+        logger.warning("No stored images for calibration, using random inputs")
+        tensors = list(torch.rand(batch_size, 3, 224, 224))
+
+    return [
+        torch.stack(tensors[i:i + batch_size], 0)
+        for i in range(0, len(tensors), batch_size)
+    ]
+
+
+def quantize_feature_extractor(model: torch.nn.Module) -> torch.nn.Module:
+    """Statically quantize the CPU extractor to INT8, calibrated on stored images.
+
+    Uses Intel Extension for PyTorch when installed, otherwise PyTorch's FX
+    graph mode quantization (FBGEMM kernels). Returns the FP32 model if
+    quantization fails.
+    """
+    example_inputs = (torch.rand(1, 3, 224, 224),)
+    try:
+        try:
+            import intel_extension_for_pytorch as ipex
+            from intel_extension_for_pytorch.quantization import convert, prepare
+
+            prepared = prepare(
+                model,
+                ipex.quantization.default_static_qconfig_mapping,
+                example_inputs=example_inputs,
+                inplace=False,
+            )
+        except ImportError:
+            ipex = None
+            from torch.ao.quantization import get_default_qconfig_mapping
+            from torch.ao.quantization.quantize_fx import convert_fx as convert
+            from torch.ao.quantization.quantize_fx import prepare_fx
+
+            prepared = prepare_fx(model, get_default_qconfig_mapping("fbgemm"), example_inputs)
 
-        # Extract features
         with torch.no_grad():
-            features = feature_extractor(img_tensor)
+            for batch in calibration_batches():
+                prepared(batch)
+
+        quantized = convert(prepared)
+        if ipex is not None:
+            with torch.no_grad():
+                quantized = torch.jit.freeze(torch.jit.trace(quantized, example_inputs))
+
+        logger.info(f"Feature extractor quantized to INT8 ({'IPEX' if ipex else 'FX'})")
+        return quantized
+
+    except Exception as e:
+        logger.warning(f"INT8 quantization failed, keeping FP32 extractor: {e}")
+        return model
+
+
+def preprocess_image(image: Image.Image) -> torch.Tensor:
+    """Convert an image to a normalized 3x224x224 model input tensor."""
+    # Convert to RGB if necessary
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return transform(image)
+
+
+def decode_and_preprocess(contents: bytes) -> torch.Tensor:
+    """Decode uploaded image bytes into a model input tensor."""
+    with Image.open(io.BytesIO(contents)) as image:
+        return preprocess_image(image)
+
+
+def load_feature_projection():
+    """Load the PCA projection from FEATURE_PROJECTION_PATH, if configured."""
+    global feature_projection
+
+    if not FEATURE_PROJECTION_PATH:
+        return
+    if not os.path.exists(FEATURE_PROJECTION_PATH):
+        logger.warning(f"Feature projection {FEATURE_PROJECTION_PATH} not found, using full features")
+        return
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    with np.load(FEATURE_PROJECTION_PATH) as projection:
+        mean = torch.from_numpy(projection["mean"]).float().to(device)
+        components = torch.from_numpy(projection["components"]).float().to(device)
+    feature_projection = (mean, components)
+    logger.info(
+        f"Feature projection loaded: {components.shape[0]} -> {components.shape[1]} dims"
+    )
+
+
+def fit_feature_projection(dim: int, path: str):
+    """Fit a PCA projection on the features of stored vehicle images and save it."""
+    global feature_projection
+
+    # Fit on unprojected features
+    feature_projection = None
+    if not load_feature_extractor(load_projection=False):
+        raise RuntimeError("Feature extractor not available")
+
+    paths = sorted(STATIC_DIR.glob("*.jpg"))
+    if len(paths) < dim:
+        raise ValueError(f"Need at least {dim} stored images, found {len(paths)}")
+    features = np.concatenate([
+        run_feature_batch([decode_and_preprocess(p.read_bytes()) for p in paths[i:i + 64]])
+        for i in range(0, len(paths), 64)
+    ])
+
+    mean = features.mean(axis=0)
+    _, _, vt = np.linalg.svd(features - mean, full_matrices=False)
+    np.savez(path, mean=mean, components=vt[:dim].T)
+    logger.info(f"Saved {features.shape[1]} -> {dim} projection fitted on {len(features)} images")
+
+
+def run_feature_batch(tensors: list[torch.Tensor]) -> np.ndarray:
+    """Run one forward pass over a batch of preprocessed images.
+
+    Returns one L2-normalized feature vector per row.
+    """
+    if torch.cuda.is_available():
+        # Stack straight into pinned memory so the host-to-device copy is async
+        batch = torch.empty((len(tensors), *tensors[0].shape), pin_memory=True)
+        torch.stack(tensors, 0, out=batch)
+        batch = batch.cuda(non_blocking=True).half()
+    else:
+        batch = torch.stack(tensors, 0)
+    batch = batch.contiguous(memory_format=torch.channels_last)
+
+    with torch.inference_mode():
+        features = feature_extractor(batch).float()
+        features = torch.nn.functional.normalize(features, dim=1)
+        if feature_projection is not None:
+            mean, components = feature_projection
+            features = torch.nn.functional.normalize((features - mean) @ components, dim=1)
+
+    return features.cpu().numpy()
+
+
+def prepare_mqtt_vector(vector: list[float]) -> Optional[np.ndarray]:
+    """Bring an externally extracted feature vector into the stored feature space.
 
-        # Convert to list and normalize
-        feature_vector = features.cpu().numpy().flatten()
-        feature_vector = feature_vector / np.linalg.norm(feature_vector)
+    Full-size vectors are projected when a PCA projection is loaded; vectors
+    that still don't have FEATURE_DIM dimensions are rejected (None).
+    """
+    features = np.asarray(vector, dtype=np.float32)
+    features /= max(float(np.linalg.norm(features)), 1e-12)
+    if feature_projection is not None:
+        mean, components = feature_projection
+        if features.size == components.shape[0]:
+            with torch.inference_mode():
+                projected = (torch.from_numpy(features).to(mean.device) - mean) @ components
+            features = projected.cpu().numpy()
+            features /= max(float(np.linalg.norm(features)), 1e-12)
+    if features.size != FEATURE_DIM:
+        return None
+    return features
+
+
+async def next_batch(queue: asyncio.Queue, max_size: int, max_wait: float) -> list:
+    """Wait for one queued item, then take more until max_size or max_wait seconds."""
+    batch = [await queue.get()]
+    deadline = time.monotonic() + max_wait
+    while len(batch) < max_size:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def feature_batcher():
+    """Collect queued images into batches and extract their features together.
+
+    Waits for the first image, then up to FEATURE_BATCH_WAIT_MS for more, so
+    concurrent requests share one forward pass of up to FEATURE_BATCH_MAX images.
+    """
+    while True:
+        batch = await next_batch(feature_queue, FEATURE_BATCH_MAX, FEATURE_BATCH_WAIT)
+        tensors, futures = zip(*batch)
+        try:
+            # Keep the event loop free while the model runs
+            features = await asyncio.get_running_loop().run_in_executor(
+                inference_executor, run_feature_batch, list(tensors)
+            )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+
+        for future, feature_vector in zip(futures, features):
+            if not future.done():
+                future.set_result(feature_vector)
+
+
+async def extract_features(contents: bytes) -> Optional[list[float]]:
+    """Extract feature vector from image bytes, batched with concurrent requests."""
+    if feature_extractor is None or transform is None or feature_queue is None:
+        logger.error("Feature extractor not loaded")
+        return None
 
+    try:
+        future = asyncio.get_running_loop().create_future()
+        # JPEG decode and resize release the GIL; keep them off the event loop
+        img_tensor = await asyncio.to_thread(decode_and_preprocess, contents)
+        await feature_queue.put((img_tensor, future))
+        feature_vector = await future
         return feature_vector.tolist()
 
     except Exception as e:
@@ -132,8 +494,18 @@ def extract_features(image: Image.Image) -> Optional[list[float]]:
         return None
 
 
-# MQTT client for receiving detection events
+# MQTT client for receiving detection events. Paho's network thread only
+# queues payloads; consumers on the event loop parse and store them in batches.
 mqtt_client: Optional[mqtt.Client] = None
+mqtt_queue: Optional[asyncio.Queue] = None
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+MQTT_QUEUE_SIZE = int(os.getenv("MQTT_QUEUE_SIZE", "10000"))
+MQTT_CONSUMERS = int(os.getenv("MQTT_CONSUMERS", "2"))
+MQTT_BATCH_MAX = int(os.getenv("MQTT_BATCH_MAX", "256"))
+MQTT_BATCH_WAIT = float(os.getenv("MQTT_BATCH_WAIT_MS", "20")) / 1000
+
+# Shared SParking API client; keeps connections alive across notifications
+http_client: Optional[httpx.AsyncClient] = None
 
 
 def on_mqtt_connect(client, userdata, flags, rc, properties=None):
@@ -147,29 +519,59 @@ def on_mqtt_connect(client, userdata, flags, rc, properties=None):
 
 
 def on_mqtt_message(client, userdata, msg):
-    """Handle incoming MQTT messages with vehicle features."""
-    try:
-        payload = json.loads(msg.payload.decode("utf-8"))
-
-        # Check if this is a feature extraction request
-        if "feature_vector" in payload and "image_url" in payload:
-            # Store feature in Milvus
-            milvus = get_milvus_index()
-            milvus.insert_feature(
-                feature_id=payload.get("id", str(uuid.uuid4())),
-                feature_vector=payload["feature_vector"],
-                camera_id=payload.get("camera_id", ""),
-                detected_at=int(time.time()),
-                confidence=payload.get("confidence", 0.5),
-                image_url=payload["image_url"],
-                vehicle_type=payload.get("vehicle_type", ""),
-                vehicle_color=payload.get("vehicle_color", ""),
-                license_plate=payload.get("license_plate", ""),
-            )
-            logger.debug(f"Stored feature from MQTT: {payload.get('id')}")
+    """Hand incoming MQTT messages to the event loop; runs on paho's network thread."""
+    event_loop.call_soon_threadsafe(enqueue_mqtt_payload, msg.payload)
 
-    except Exception as e:
-        logger.error(f"Error processing MQTT message: {e}")
+
+def enqueue_mqtt_payload(payload: bytes):
+    """Queue a raw MQTT payload for the consumers; runs on the event loop."""
+    try:
+        mqtt_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        logger.warning("MQTT queue full, dropping message")
+
+
+async def mqtt_consumer():
+    """Parse queued MQTT messages with vehicle features and store them in batches."""
+    milvus = await get_milvus_index_async()
+    while True:
+        rows = []
+        for raw in await next_batch(mqtt_queue, MQTT_BATCH_MAX, MQTT_BATCH_WAIT):
+            try:
+                payload = orjson.loads(raw)
+
+                # Check if this is a feature extraction request
+                if "feature_vector" in payload and "image_url" in payload:
+                    feature_vector = prepare_mqtt_vector(payload["feature_vector"])
+                    if feature_vector is None:
+                        logger.warning(
+                            f"Dropping MQTT feature with {len(payload['feature_vector'])} dims, "
+                            f"expected {FEATURE_DIM}"
+                        )
+                        continue
+                    rows.append(feature_row(
+                        feature_id=str(payload.get("id") or make_id()),
+                        feature_vector=feature_vector,
+                        camera_id=payload.get("camera_id", ""),
+                        detected_at=int(time.time()),
+                        confidence=float(payload.get("confidence", 0.5)),
+                        image_url=payload["image_url"],
+                        vehicle_type=payload.get("vehicle_type", ""),
+                        vehicle_color=payload.get("vehicle_color", ""),
+                        license_plate=payload.get("license_plate", ""),
+                    ))
+
+            except Exception as e:
+                logger.error(f"Error processing MQTT message: {e}")
+
+        # Store features in Milvus
+        if rows and await milvus.ainsert_feature_batch(rows):
+            logger.debug(f"Stored {len(rows)} features from MQTT")
+            if recent_features is not None:
+                try:
+                    recent_features.add(rows)
+                except Exception as e:
+                    logger.error(f"Failed to cache MQTT features: {e}")
 
 
 def start_mqtt_client():
@@ -195,31 +597,59 @@ def start_mqtt_client():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    global feature_queue, http_client, mqtt_queue, event_loop
+
     # Startup
     logger.info("Starting Feature Matching Service")
 
     # Load feature extractor
-    if not load_feature_extractor():
+    batcher_task = None
+    if load_feature_extractor():
+        feature_queue = asyncio.Queue()
+        batcher_task = asyncio.create_task(feature_batcher())
+    else:
         logger.warning("Feature extractor not available, running in limited mode")
 
     # Connect to Milvus
-    milvus = get_milvus_index()
+    milvus = await get_milvus_index_async()
     if milvus.collection:
         logger.info("Connected to MilvusDB")
     else:
         logger.warning("MilvusDB not available")
 
-    # Start MQTT client
+    # HTTP/2 is negotiated when SPARKING_API is served over TLS
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        headers={
+            "Content-Type": "application/json",
+            "x-api-key": DETECTION_API_KEY,
+        },
+    )
+
+    # Start MQTT consumers, then the client feeding them
+    event_loop = asyncio.get_running_loop()
+    mqtt_queue = asyncio.Queue(maxsize=MQTT_QUEUE_SIZE)
+    consumer_tasks = [asyncio.create_task(mqtt_consumer()) for _ in range(MQTT_CONSUMERS)]
     start_mqtt_client()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Feature Matching Service")
+    if batcher_task:
+        batcher_task.cancel()
+    inference_executor.shutdown(wait=False, cancel_futures=True)
+    if pending_writes:
+        await asyncio.wait(list(pending_writes.values()))
     if mqtt_client:
         mqtt_client.loop_stop()
         mqtt_client.disconnect()
-    milvus.close()
+    for task in consumer_tasks:
+        task.cancel()
+    await http_client.aclose()
+    await milvus.aclose()
 
 
 # FastAPI app
@@ -279,7 +709,7 @@ class HealthResponse(BaseModel):
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    milvus = get_milvus_index()
+    milvus = await get_milvus_index_async()
     return HealthResponse(
         status="healthy",
         milvus_connected=milvus.collection is not None,
@@ -291,7 +721,7 @@ async def health_check():
 @app.get("/stats", response_model=IndexStats)
 async def get_stats():
     """Get index statistics."""
-    milvus = get_milvus_index()
+    milvus = await get_milvus_index_async()
     stats = milvus.get_stats()
     if not stats:
         raise HTTPException(status_code=503, detail="MilvusDB not available")
@@ -322,10 +752,9 @@ async def search_by_image(
     try:
         # Read and process image
         contents = await image.read()
-        pil_image = Image.open(io.BytesIO(contents))
 
         # Extract features
-        features = extract_features(pil_image)
+        features = await extract_features(contents)
         if features is None:
             raise HTTPException(
                 status_code=400,
@@ -337,14 +766,23 @@ async def search_by_image(
         if camera_ids:
             camera_id_list = [cid.strip() for cid in camera_ids.split(",")]
 
-        # Search in Milvus
-        milvus = get_milvus_index()
-        results = milvus.search_similar(
-            query_vector=features,
-            limit=limit,
-            camera_ids=camera_id_list,
-            min_confidence=min_confidence,
-        )
+        results = None
+        if recent_features is not None and not camera_id_list and min_confidence == 0:
+            # Unfiltered search over the recent window, in process
+            results = recent_features.search(features, limit)
+            if len(results) < limit or results[0]["score"] < SEARCH_CACHE_MIN_SCORE:
+                results = None
+
+        if results is None:
+            # Search in Milvus
+            milvus = await get_milvus_index_async()
+            results = await milvus.asearch_similar(
+                query_vector=features,
+                limit=limit,
+                camera_ids=camera_id_list,
+                min_confidence=min_confidence,
+                output_fields=MATCH_FIELDS,
+            )
 
         query_time = (time.time() - start_time) * 1000
 
@@ -361,6 +799,32 @@ async def search_by_image(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def forget_indexed_image(feature_id: str):
+    """Drop dedupe entries for a feature so a re-upload indexes it again."""
+    for digest in [d for d, fid in indexed_images.items() if fid == feature_id]:
+        del indexed_images[digest]
+
+
+async def save_image(image_path: Path, contents: bytes) -> bool:
+    """Write an uploaded image to the static directory, logging failures."""
+    try:
+        async with aiofiles.open(image_path, "wb") as f:
+            await f.write(contents)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save image {image_path.name}: {e}")
+        forget_indexed_image(image_path.stem)
+        return False
+
+
+def persist_image(image_path: Path, contents: bytes) -> asyncio.Task:
+    """Write an uploaded image in the background, off the request path."""
+    task = asyncio.create_task(save_image(image_path, contents))
+    pending_writes[image_path] = task
+    task.add_done_callback(lambda _: pending_writes.pop(image_path, None))
+    return task
+
+
 @app.post("/index")
 async def index_image(
     image: UploadFile = File(...),
@@ -384,10 +848,39 @@ async def index_image(
     try:
         # Read and process image
         contents = await image.read()
-        pil_image = Image.open(io.BytesIO(contents))
+
+        # Return the existing feature for an image already indexed with the
+        # same metadata, still reporting the detection to SParking
+        hasher = hashlib.blake2b(contents, digest_size=16)
+        hasher.update(orjson.dumps(
+            [camera_id, vehicle_type, vehicle_color, license_plate, confidence]
+        ))
+        digest = hasher.digest()
+        feature_id = indexed_images.get(digest)
+        if feature_id is not None:
+            image_path = STATIC_DIR / f"{feature_id}.jpg"
+            if image_path in pending_writes or image_path.exists():
+                indexed_images.move_to_end(digest)
+                image_url = f"/static/{feature_id}.jpg"
+                await notify_sparking_api(
+                    feature_id=feature_id,
+                    camera_id=camera_id,
+                    image_url=image_url,
+                    vehicle_type=vehicle_type,
+                    vehicle_color=vehicle_color,
+                    license_plate=license_plate,
+                    confidence=confidence,
+                )
+                return {
+                    "success": True,
+                    "id": feature_id,
+                    "image_url": image_url,
+                }
+            # Deleted (possibly through another worker)
+            del indexed_images[digest]
 
         # Extract features
-        features = extract_features(pil_image)
+        features = await extract_features(contents)
         if features is None:
             raise HTTPException(
                 status_code=400,
@@ -395,19 +888,17 @@ async def index_image(
             )
 
         # Generate ID and save image
-        feature_id = str(uuid.uuid4())
+        feature_id = make_id()
         image_filename = f"{feature_id}.jpg"
         image_path = STATIC_DIR / image_filename
 
-        # Save image
-        async with aiofiles.open(image_path, "wb") as f:
-            await f.write(contents)
-
         image_url = f"/static/{image_filename}"
 
-        # Store in Milvus
-        milvus = get_milvus_index()
-        success = milvus.insert_feature(
+        # Save image in the background and store in Milvus
+        image_write = persist_image(image_path, contents)
+        milvus = await get_milvus_index_async()
+        success = await asyncio.to_thread(
+            milvus.insert_feature,
             feature_id=feature_id,
             feature_vector=features,
             camera_id=camera_id,
@@ -417,6 +908,7 @@ async def index_image(
             vehicle_type=vehicle_type or "",
             vehicle_color=vehicle_color or "",
             license_plate=license_plate or "",
+            wait=True,
         )
 
         if not success:
@@ -425,6 +917,25 @@ async def index_image(
                 detail="Failed to store features in database",
             )
 
+        if recent_features is not None:
+            recent_features.add([feature_row(
+                feature_id=feature_id,
+                feature_vector=features,
+                camera_id=camera_id,
+                detected_at=int(time.time()),
+                confidence=confidence,
+                image_url=image_url,
+                vehicle_type=vehicle_type or "",
+                vehicle_color=vehicle_color or "",
+                license_plate=license_plate or "",
+            )])
+
+        # Only dedupe re-uploads once the image file is (or may still be) saved
+        if not (image_write.done() and not image_write.result()):
+            indexed_images[digest] = feature_id
+            if len(indexed_images) > INDEXED_IMAGE_CACHE_SIZE:
+                indexed_images.popitem(last=False)
+
         # Notify SParking API
         await notify_sparking_api(
             feature_id=feature_id,
@@ -452,8 +963,8 @@ async def index_image(
 @app.delete("/index/{feature_id}")
 async def delete_feature(feature_id: str):
     """Delete a feature from the index."""
-    milvus = get_milvus_index()
-    success = milvus.delete_feature(feature_id)
+    milvus = await get_milvus_index_async()
+    success = await milvus.adelete_feature(feature_id)
 
     if not success:
         raise HTTPException(
@@ -461,8 +972,17 @@ async def delete_feature(feature_id: str):
             detail="Failed to delete feature",
         )
 
-    # Also delete image file
+    if recent_features is not None:
+        recent_features.remove(feature_id)
+
+    # Let a re-upload of the image index it again
+    forget_indexed_image(feature_id)
+
+    # Also delete image file, once any background write to it has finished
     image_path = STATIC_DIR / f"{feature_id}.jpg"
+    image_write = pending_writes.get(image_path)
+    if image_write is not None:
+        await asyncio.wait([image_write])
     if image_path.exists():
         image_path.unlink()
 
@@ -480,39 +1000,40 @@ async def notify_sparking_api(
 ):
     """Notify SParking API about new indexed feature."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SPARKING_API}/api/realtime/detection",
-                json={
-                    "cameraId": camera_id,
-                    "eventType": "VEHICLE_DETECTED",
-                    "confidence": confidence,
-                    "vehicleType": vehicle_type,
-                    "vehicleColor": vehicle_color,
-                    "licensePlate": license_plate,
-                    "metadata": {
-                        "featureId": feature_id,
-                        "imageUrl": image_url,
-                        "source": "feature-matching",
-                    },
+        response = await http_client.post(
+            f"{SPARKING_API}/api/realtime/detection",
+            content=orjson.dumps({
+                "cameraId": camera_id,
+                "eventType": "VEHICLE_DETECTED",
+                "confidence": confidence,
+                "vehicleType": vehicle_type,
+                "vehicleColor": vehicle_color,
+                "licensePlate": license_plate,
+                "metadata": {
+                    "featureId": feature_id,
+                    "imageUrl": image_url,
+                    "source": "feature-matching",
                 },
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": DETECTION_API_KEY,
-                },
-                timeout=10.0,
-            )
+            }),
+        )
 
-            if response.status_code not in (200, 201):
-                logger.warning(
-                    f"SParking API notification failed: {response.status_code}"
-                )
+        if response.status_code not in (200, 201):
+            logger.warning(
+                f"SParking API notification failed: {response.status_code}"
+            )
 
     except Exception as e:
         logger.warning(f"Failed to notify SParking API: {e}")
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["fit-projection"]:
+        fit_feature_projection(
+            int(sys.argv[2]) if len(sys.argv) > 2 else 128,
+            FEATURE_PROJECTION_PATH or "feature_projection.npz",
+        )
+        sys.exit(0)
+
     import uvicorn
 
     uvicorn.run(app, host="0.0.0.0", port=8000)
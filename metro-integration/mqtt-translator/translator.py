@@ -6,19 +6,35 @@ Subscribes to Metro AI Suite object detection MQTT topics and translates
 detection messages to SParking format, forwarding them to the SParking API.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 from typing import Any
 
+import httpx
+import orjson
 import paho.mqtt.client as mqtt
-import requests
 import yaml
 
 
+# ${VAR} / ${VAR:-default} references in the config file
+ENV_VAR_PATTERN = re.compile(r'\$\{(\w+)(?::-([^}]*))?\}')
+
+# libyaml's C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _replace_env(match: re.Match) -> str:
+    var_name = match.group(1)
+    default_value = match.group(2) or ""
+    return os.getenv(var_name, default_value)
+
+
 # Load configuration
 def load_config() -> dict:
     """Load configuration from YAML file with environment variable substitution."""
@@ -28,15 +44,8 @@ def load_config() -> dict:
         content = f.read()
 
     # Substitute environment variables
-    pattern = re.compile(r'\$\{(\w+)(?::-([^}]*))?\}')
-
-    def replace_env(match):
-        var_name = match.group(1)
-        default_value = match.group(2) or ""
-        return os.getenv(var_name, default_value)
-
-    content = pattern.sub(replace_env, content)
-    return yaml.safe_load(content)
+    content = ENV_VAR_PATTERN.sub(_replace_env, content)
+    return yaml.load(content, Loader=YamlLoader)
 
 
 # Initialize logging
@@ -57,7 +66,6 @@ class MetroTranslator:
         self.config = config
         self.logger = logger
         self.mqtt_client = None
-        self.session = requests.Session()
 
         # Load camera mappings
         self.camera_mappings = self._load_camera_mappings()
@@ -67,6 +75,16 @@ class MetroTranslator:
         self.min_confidence = detection_config.get("min_confidence", 0.5)
         self.tracked_labels = set(detection_config.get("tracked_labels", ["car"]))
         self.label_mapping = detection_config.get("label_mapping", {})
+        # Tracked label -> SParking vehicle type, so each object is one lookup
+        self._label_types = {
+            label: self.label_mapping.get(label, label.upper())
+            for label in self.tracked_labels
+        }
+
+        # Topic prefix, e.g. "object_detection_" for "object_detection_1"
+        prefix = config.get("metro", {}).get("topic_prefix", "object_detection")
+        self._topic_prefix = prefix + "_"
+        self._prefix_len = len(self._topic_prefix)
 
         # API settings
         api_config = config.get("api", {})
@@ -75,11 +93,24 @@ class MetroTranslator:
         self.api_timeout = api_config.get("timeout", 10)
         self.retry_attempts = api_config.get("retry_attempts", 3)
         self.retry_delay = api_config.get("retry_delay", 1)
+        self.batch_size = api_config.get("batch_size", 64)
+        self.batch_wait = api_config.get("batch_wait_ms", 20) / 1000
+        self.queue_size = api_config.get("queue_size", 10000)
+        self.max_connections = api_config.get("max_connections", 32)
 
-        # Set up session headers
+        # Request headers
+        self.headers = {"Content-Type": "application/json"}
         if self.api_key:
-            self.session.headers["x-api-key"] = self.api_key
-        self.session.headers["Content-Type"] = "application/json"
+            self.headers["x-api-key"] = self.api_key
+
+        # Events are forwarded from an event loop on a dedicated thread, so
+        # the MQTT network thread never waits on the API
+        self._loop = asyncio.new_event_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._stopping = False
+        self._forwarder = threading.Thread(
+            target=self._loop.run_forever, name="api-forwarder", daemon=True
+        )
 
     def _load_camera_mappings(self) -> dict:
         """Load camera mappings from config or environment."""
@@ -97,9 +128,8 @@ class MetroTranslator:
     def _get_camera_id(self, topic: str) -> str | None:
         """Extract camera ID from MQTT topic."""
         # Extract suffix from topic (e.g., "object_detection_1" -> "1")
-        prefix = self.config.get("metro", {}).get("topic_prefix", "object_detection")
-        if topic.startswith(prefix + "_"):
-            suffix = topic[len(prefix) + 1:]
+        if topic.startswith(self._topic_prefix):
+            suffix = topic[self._prefix_len:]
             return self.camera_mappings.get(suffix, suffix)
         return None
 
@@ -139,15 +169,20 @@ class MetroTranslator:
         metadata = payload.get("metadata", {})
         objects = metadata.get("objects", [])
 
+        # Most objects in a dense frame are rejected; keep that path to local lookups
+        label_types = self._label_types
+        min_confidence = self.min_confidence
+
         for obj in objects:
             detection = obj.get("detection", {})
-            label = detection.get("label", "").lower()
             confidence = detection.get("confidence", 0)
-
-            # Filter by label and confidence
-            if label not in self.tracked_labels:
+            if confidence < min_confidence:
                 continue
-            if confidence < self.min_confidence:
+
+            # Filter by label
+            label = detection.get("label", "").lower()
+            vehicle_type = label_types.get(label)
+            if vehicle_type is None:
                 continue
 
             # Extract bounding box
@@ -168,7 +203,7 @@ class MetroTranslator:
                     "width": x_max - x_min,
                     "height": y_max - y_min
                 },
-                "vehicleType": self.label_mapping.get(label, label.upper()),
+                "vehicleType": vehicle_type,
                 "metadata": {
                     "source": "metro-ai-suite",
                     "originalLabel": label
@@ -187,15 +222,11 @@ class MetroTranslator:
 
         return events
 
-    def forward_to_api(self, event: dict) -> bool:
+    async def forward_to_api(self, client: httpx.AsyncClient, event: dict) -> bool:
         """Forward translated event to SParking API with retry logic."""
         for attempt in range(self.retry_attempts):
             try:
-                response = self.session.post(
-                    self.api_endpoint,
-                    json=event,
-                    timeout=self.api_timeout
-                )
+                response = await client.post(self.api_endpoint, content=orjson.dumps(event))
 
                 if response.status_code in (200, 201):
                     self.logger.debug(f"Successfully forwarded event: {event.get('eventType')}")
@@ -207,15 +238,82 @@ class MetroTranslator:
                     self.logger.warning(
                         f"API returned status {response.status_code}: {response.text}"
                     )
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
                 self.logger.warning(f"API request failed (attempt {attempt + 1}): {e}")
+            except Exception as e:
+                # Not transient (e.g. an event that cannot be serialized); don't retry
+                self.logger.error(f"Failed to forward event: {e}", exc_info=True)
+                return False
 
             if attempt < self.retry_attempts - 1:
-                time.sleep(self.retry_delay)
+                # Exponential backoff: retry_delay, 2x, 4x, ...
+                await asyncio.sleep(self.retry_delay * 2 ** attempt)
 
         self.logger.error(f"Failed to forward event after {self.retry_attempts} attempts")
         return False
 
+    async def _forward_batches(self):
+        """Collect queued events into batches and POST each batch concurrently.
+
+        Waits for the first event, then up to batch_wait_ms for more, so a burst
+        of detections shares connections instead of queueing one request at a time.
+        """
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=self.api_timeout,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        ) as client:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = time.monotonic() + self.batch_wait
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # The API takes one event per request
+                try:
+                    results = await asyncio.gather(
+                        *(self.forward_to_api(client, event) for event in batch),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            self.logger.error(f"Failed to forward event: {result!r}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+    def _start_forwarding(self):
+        """Run the batch forwarder on the forwarder loop, restarting it if it dies."""
+        future = asyncio.run_coroutine_threadsafe(self._forward_batches(), self._loop)
+        future.add_done_callback(self._on_forwarder_done)
+
+    def _on_forwarder_done(self, future):
+        """Log why the forwarder stopped and start a new one after retry_delay."""
+        if self._stopping or future.cancelled():
+            return
+        self.logger.error(
+            "Event forwarder stopped unexpectedly, restarting", exc_info=future.exception()
+        )
+        self._loop.call_soon_threadsafe(
+            self._loop.call_later, self.retry_delay, self._start_forwarding
+        )
+
+    def _enqueue(self, events: list[dict]):
+        """Queue translated events for forwarding; runs on the forwarder loop."""
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.logger.warning("Forwarding queue full, dropping event")
+                return
+
     def on_connect(self, client: mqtt.Client, userdata: Any, flags: dict, rc: int, properties=None):
         """Handle MQTT connection."""
         if rc == 0:
@@ -238,17 +336,16 @@ class MetroTranslator:
         """Handle incoming MQTT messages."""
         try:
             topic = msg.topic
-            payload = json.loads(msg.payload.decode("utf-8"))
+            payload = orjson.loads(msg.payload)
 
             self.logger.debug(f"Received message on {topic}")
 
-            # Translate and forward
+            # Translate and hand off for forwarding
             events = self.translate_message(topic, payload)
+            if events:
+                self._loop.call_soon_threadsafe(self._enqueue, events)
 
-            for event in events:
-                self.forward_to_api(event)
-
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in message: {e}")
         except Exception as e:
             self.logger.error(f"Error processing message: {e}", exc_info=True)
@@ -263,6 +360,10 @@ class MetroTranslator:
             client_id=mqtt_config.get("client_id", "metro-translator")
         )
 
+        # Start forwarding before any message can arrive
+        self._forwarder.start()
+        self._start_forwarding()
+
         # Set callbacks
         self.mqtt_client.on_connect = self.on_connect
         self.mqtt_client.on_disconnect = self.on_disconnect
@@ -287,11 +388,20 @@ class MetroTranslator:
         self.mqtt_client.loop_forever()
 
     def stop(self):
-        """Stop the translator."""
+        """Stop the translator, forwarding already queued events first."""
+        self._stopping = True
         if self.mqtt_client:
             self.mqtt_client.disconnect()
             self.mqtt_client.loop_stop()
 
+        if self._forwarder.is_alive():
+            drained = asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop)
+            try:
+                drained.result(timeout=self.api_timeout)
+            except TimeoutError:
+                self.logger.warning("Timed out forwarding queued events")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
 
 def main():
     """Main entry point."""